@@ -0,0 +1,43 @@
+"""Índices compuestos en inmuebles
+
+Sustituye los índices simples de provincia_id y municipio_id por índices
+compuestos que cubren los patrones de consulta habituales.
+
+La migración inicial usa Base.metadata.create_all(), por lo que en una base
+de datos nueva los índices ya existen: las operaciones son idempotentes.
+
+Revision ID: a3f1c2d4e5b6
+Revises: 6ce5012d6481
+Create Date: 2026-10-16 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from app.db.base import DB_SCHEMA
+
+# revision identifiers, used by Alembic.
+revision = 'a3f1c2d4e5b6'
+down_revision = '6ce5012d6481'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_inm_prov_activo', 'inmuebles', ['provincia_id', 'activo'],
+        schema=DB_SCHEMA, postgresql_include=['nombre'], if_not_exists=True,
+    )
+    op.create_index(
+        'ix_inm_mun_tipo', 'inmuebles', ['municipio_id', 'tipo_inmueble_id'],
+        schema=DB_SCHEMA, postgresql_include=['nombre'], if_not_exists=True,
+    )
+    op.drop_index(f'ix_{DB_SCHEMA}_inmuebles_provincia_id', table_name='inmuebles', schema=DB_SCHEMA, if_exists=True)
+    op.drop_index(f'ix_{DB_SCHEMA}_inmuebles_municipio_id', table_name='inmuebles', schema=DB_SCHEMA, if_exists=True)
+
+
+def downgrade() -> None:
+    op.create_index(f'ix_{DB_SCHEMA}_inmuebles_municipio_id', 'inmuebles', ['municipio_id'], schema=DB_SCHEMA)
+    op.create_index(f'ix_{DB_SCHEMA}_inmuebles_provincia_id', 'inmuebles', ['provincia_id'], schema=DB_SCHEMA)
+    op.drop_index('ix_inm_mun_tipo', table_name='inmuebles', schema=DB_SCHEMA)
+    op.drop_index('ix_inm_prov_activo', table_name='inmuebles', schema=DB_SCHEMA)
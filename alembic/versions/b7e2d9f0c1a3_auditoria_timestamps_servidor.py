@@ -0,0 +1,38 @@
+"""Timestamps de auditoría generados en el servidor
+
+created_at pasa a tener DEFAULT now() en todas las tablas con AuditMixin.
+
+Revision ID: b7e2d9f0c1a3
+Revises: a3f1c2d4e5b6
+Create Date: 2026-10-16 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from app.db.base import DB_SCHEMA
+
+# revision identifiers, used by Alembic.
+revision = 'b7e2d9f0c1a3'
+down_revision = 'a3f1c2d4e5b6'
+branch_labels = None
+depends_on = None
+
+
+def _audited_tables():
+    """Tablas del schema que tienen columna created_at"""
+    inspector = sa.inspect(op.get_bind())
+    for table_name in inspector.get_table_names(schema=DB_SCHEMA):
+        columns = {col["name"] for col in inspector.get_columns(table_name, schema=DB_SCHEMA)}
+        if "created_at" in columns:
+            yield table_name
+
+
+def upgrade() -> None:
+    for table_name in _audited_tables():
+        op.alter_column(table_name, 'created_at', server_default=sa.func.now(), schema=DB_SCHEMA)
+
+
+def downgrade() -> None:
+    for table_name in _audited_tables():
+        op.alter_column(table_name, 'created_at', server_default=None, schema=DB_SCHEMA)
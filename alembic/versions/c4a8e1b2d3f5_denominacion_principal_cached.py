@@ -0,0 +1,97 @@
+"""Denominación principal desnormalizada en inmuebles
+
+Añade inmuebles.denominacion_principal_cached y un trigger sobre
+inmuebles_denominaciones que la mantiene sincronizada con la fila
+marcada como es_principal.
+
+Revision ID: c4a8e1b2d3f5
+Revises: b7e2d9f0c1a3
+Create Date: 2026-10-16 11:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from app.db.base import DB_SCHEMA
+
+# revision identifiers, used by Alembic.
+revision = 'c4a8e1b2d3f5'
+down_revision = 'b7e2d9f0c1a3'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # IF NOT EXISTS: en bases nuevas create_all() ya ha creado columna e índice
+    op.execute(f"""
+        ALTER TABLE {DB_SCHEMA}.inmuebles
+        ADD COLUMN IF NOT EXISTS denominacion_principal_cached VARCHAR(255)
+    """)
+    op.create_index(
+        f'ix_{DB_SCHEMA}_inmuebles_denominacion_principal_cached', 'inmuebles',
+        ['denominacion_principal_cached'], schema=DB_SCHEMA, if_not_exists=True,
+    )
+
+    op.execute(f"""
+        CREATE OR REPLACE FUNCTION {DB_SCHEMA}.refresh_denominacion_principal(p_inmueble_id VARCHAR)
+        RETURNS void AS $$
+        BEGIN
+            UPDATE {DB_SCHEMA}.inmuebles
+            SET denominacion_principal_cached = (
+                SELECT d.denominacion
+                FROM {DB_SCHEMA}.inmuebles_denominaciones d
+                WHERE d.inmueble_id = p_inmueble_id
+                  AND d.es_principal
+                  AND d.deleted_at IS NULL
+                ORDER BY d.created_at
+                LIMIT 1
+            )
+            WHERE id = p_inmueble_id;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute(f"""
+        CREATE OR REPLACE FUNCTION {DB_SCHEMA}.sync_denominacion_principal()
+        RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP IN ('UPDATE', 'DELETE') THEN
+                PERFORM {DB_SCHEMA}.refresh_denominacion_principal(OLD.inmueble_id);
+            END IF;
+            IF TG_OP = 'INSERT'
+               OR (TG_OP = 'UPDATE' AND NEW.inmueble_id IS DISTINCT FROM OLD.inmueble_id) THEN
+                PERFORM {DB_SCHEMA}.refresh_denominacion_principal(NEW.inmueble_id);
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute(f"DROP TRIGGER IF EXISTS trg_sync_denominacion_principal ON {DB_SCHEMA}.inmuebles_denominaciones")
+    op.execute(f"""
+        CREATE TRIGGER trg_sync_denominacion_principal
+        AFTER INSERT OR UPDATE OR DELETE ON {DB_SCHEMA}.inmuebles_denominaciones
+        FOR EACH ROW EXECUTE FUNCTION {DB_SCHEMA}.sync_denominacion_principal()
+    """)
+
+    # Rellenar los inmuebles existentes
+    op.execute(f"""
+        UPDATE {DB_SCHEMA}.inmuebles i
+        SET denominacion_principal_cached = d.denominacion
+        FROM (
+            SELECT DISTINCT ON (inmueble_id) inmueble_id, denominacion
+            FROM {DB_SCHEMA}.inmuebles_denominaciones
+            WHERE es_principal AND deleted_at IS NULL
+            ORDER BY inmueble_id, created_at
+        ) d
+        WHERE d.inmueble_id = i.id
+    """)
+
+
+def downgrade() -> None:
+    op.execute(f"DROP TRIGGER IF EXISTS trg_sync_denominacion_principal ON {DB_SCHEMA}.inmuebles_denominaciones")
+    op.execute(f"DROP FUNCTION IF EXISTS {DB_SCHEMA}.sync_denominacion_principal()")
+    op.execute(f"DROP FUNCTION IF EXISTS {DB_SCHEMA}.refresh_denominacion_principal(VARCHAR)")
+    op.drop_index(
+        f'ix_{DB_SCHEMA}_inmuebles_denominacion_principal_cached',
+        table_name='inmuebles', schema=DB_SCHEMA, if_exists=True,
+    )
+    op.drop_column('inmuebles', 'denominacion_principal_cached', schema=DB_SCHEMA)
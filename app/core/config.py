@@ -9,13 +9,21 @@ DATABASE_URL = get_env("DATABASE_URL", "postgresql+asyncpg://sipi:sipi@db:5432/s
 
 # SQLAlchemy (aplica a sync y async)
 SQLALCHEMY_ECHO = get_env("SQLALCHEMY_ECHO", "false").lower() == "true"
-POOL_SIZE = int(get_env("POOL_SIZE", "20"))
-POOL_MAX_OVERFLOW = int(get_env("POOL_MAX_OVERFLOW", "10"))
+POOL_SIZE = int(get_env("POOL_SIZE", "25"))
+POOL_MAX_OVERFLOW = int(get_env("POOL_MAX_OVERFLOW", "25"))
 POOL_TIMEOUT = int(get_env("POOL_TIMEOUT", "30"))
-POOL_RECYCLE = int(get_env("POOL_RECYCLE", "3600"))
+POOL_RECYCLE = int(get_env("POOL_RECYCLE", "300"))
+# Conexiones abiertas en el arranque (0 desactiva el calentamiento)
+POOL_WARMUP = int(get_env("POOL_WARMUP", str(POOL_SIZE)))
+# Caché de sentencias preparadas por conexión (asyncpg)
+STATEMENT_CACHE_SIZE = int(get_env("STATEMENT_CACHE_SIZE", "1024"))
 
 # GraphQL
 GRAPHQL_MAX_DEPTH = int(get_env("GRAPHQL_MAX_DEPTH", "10"))
+# Tope del argumento 'limit' en las queries list/search
+GRAPHQL_MAX_LIMIT = int(get_env("GRAPHQL_MAX_LIMIT", "200"))
+# Modelos expuestos en el schema (nombres separados por comas); vacío = todos
+GRAPHQL_MODELS = [name.strip() for name in get_env("GRAPHQL_MODELS", "").split(",") if name.strip()]
 
 # Environment
 ENVIRONMENT = get_env("ENVIRONMENT", "development")
@@ -30,7 +38,11 @@ class SimpleSettings:
         self.POOL_MAX_OVERFLOW = POOL_MAX_OVERFLOW
         self.POOL_TIMEOUT = POOL_TIMEOUT
         self.POOL_RECYCLE = POOL_RECYCLE
+        self.POOL_WARMUP = POOL_WARMUP
+        self.STATEMENT_CACHE_SIZE = STATEMENT_CACHE_SIZE
         self.GRAPHQL_MAX_DEPTH = GRAPHQL_MAX_DEPTH
+        self.GRAPHQL_MAX_LIMIT = GRAPHQL_MAX_LIMIT
+        self.GRAPHQL_MODELS = GRAPHQL_MODELS
         self.ENVIRONMENT = ENVIRONMENT
 
 # ✅ EXPORTA LA INSTANCIA GLOBAL 'settings'
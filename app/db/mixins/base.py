@@ -2,7 +2,7 @@
 from datetime import datetime, timezone
 import uuid
 from typing import Optional, TYPE_CHECKING
-from sqlalchemy import String, DateTime
+from sqlalchemy import String, DateTime, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship, declared_attr
 from sqlalchemy.schema import ForeignKey
 
@@ -20,16 +20,16 @@ class UUIDPKMixin:
 class AuditMixin:
     """Auditoría de creación, modificación y eliminación lógica"""
     
-    # Timestamps
+    # Timestamps (generados por PostgreSQL, no en Python)
     created_at: Mapped[datetime] = mapped_column(
         DateTime, 
-        default=lambda: datetime.now(timezone.utc), 
+        server_default=func.now(), 
         nullable=False, 
         index=True
     )
     updated_at: Mapped[Optional[datetime]] = mapped_column(
         DateTime, 
-        onupdate=lambda: datetime.now(timezone.utc), 
+        onupdate=func.now(), 
         index=True
     )
     deleted_at: Mapped[Optional[datetime]] = mapped_column(
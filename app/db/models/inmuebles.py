@@ -3,7 +3,7 @@ from datetime import datetime
 from typing import Optional, List
 from decimal import Decimal
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy import String, Text, Numeric, Boolean, ForeignKey
+from sqlalchemy import String, Text, Numeric, Boolean, ForeignKey, Index
 from geoalchemy2 import Geometry
 
 from app.db.base import Base
@@ -16,9 +16,14 @@ class Inmueble(UUIDPKMixin, AuditMixin, Base):
     nombre: Mapped[str] = mapped_column(String(255), index=True)
     descripcion: Mapped[Optional[str]] = mapped_column(Text)
     
+    # Copia desnormalizada de la denominación principal (es_principal = true).
+    # La mantiene el trigger trg_sync_denominacion_principal sobre inmuebles_denominaciones.
+    denominacion_principal_cached: Mapped[Optional[str]] = mapped_column(String(255), index=True)
+    
     comunidad_autonoma_id: Mapped[Optional[str]] = mapped_column(String(36), ForeignKey("comunidades_autonomas.id"), index=True)
-    provincia_id: Mapped[Optional[str]] = mapped_column(String(36), ForeignKey("provincias.id"), index=True)
-    municipio_id: Mapped[Optional[str]] = mapped_column(String(36), ForeignKey("municipios.id"), index=True)
+    # provincia_id y municipio_id se indexan vía los índices compuestos de __table_args__
+    provincia_id: Mapped[Optional[str]] = mapped_column(String(36), ForeignKey("provincias.id"))
+    municipio_id: Mapped[Optional[str]] = mapped_column(String(36), ForeignKey("municipios.id"))
     direccion: Mapped[Optional[str]] = mapped_column(String(500))
     coordenadas: Mapped[Optional[Geometry]] = mapped_column(Geometry(geometry_type='POINT', srid=4326))
     
@@ -58,6 +63,13 @@ class Inmueble(UUIDPKMixin, AuditMixin, Base):
     documentos: Mapped[List["InmuebleDocumento"]] = relationship("InmuebleDocumento", back_populates="inmueble", cascade="all, delete-orphan")
     actuaciones: Mapped[List["Actuacion"]] = relationship("Actuacion", back_populates="inmueble", cascade="all, delete-orphan")
     transmisiones: Mapped[List["Transmision"]] = relationship("Transmision", back_populates="inmueble", cascade="all, delete-orphan")
+    
+    __table_args__ = (
+        # Listados por provincia filtrando activos; INCLUDE nombre permite index-only scans
+        Index('ix_inm_prov_activo', 'provincia_id', 'activo', postgresql_include=['nombre']),
+        # Listados por municipio y tipología
+        Index('ix_inm_mun_tipo', 'municipio_id', 'tipo_inmueble_id', postgresql_include=['nombre']),
+    )
 
 
 class Inmatriculacion(UUIDPKMixin, AuditMixin, Base):
@@ -96,7 +108,8 @@ class InmuebleOSMExt(UUIDPKMixin, AuditMixin, Base):
     inmueble_id: Mapped[str] = mapped_column(String(36), ForeignKey("inmuebles.id"), index=True)
     osm_type: Mapped[str] = mapped_column(String(10))
     osm_id: Mapped[str] = mapped_column(String(50), index=True)
-    osm_tags: Mapped[Optional[str]] = mapped_column(Text)
+    # Columna pesada (TOAST): solo se carga si se pide con undefer_group("osm_raw")
+    osm_tags: Mapped[Optional[str]] = mapped_column(Text, deferred=True, deferred_group="osm_raw")
     
     inmueble: Mapped["Inmueble"] = relationship("Inmueble", back_populates="osm_ext")
 
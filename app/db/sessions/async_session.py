@@ -1,8 +1,22 @@
 """SQLAlchemy Async Session Factory"""
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+import asyncio
+import logging
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.pool import AsyncAdaptedQueuePool
 from app.core.config import settings
 
+logger = logging.getLogger(__name__)
+
+# asyncpg: reutiliza las sentencias preparadas en cada conexión del pool
+connect_args = {}
+if settings.DATABASE_URL.startswith("postgresql+asyncpg"):
+    connect_args = {
+        "statement_cache_size": settings.STATEMENT_CACHE_SIZE,
+        "prepared_statement_cache_size": settings.STATEMENT_CACHE_SIZE,
+        # Consultas OLTP cortas: el JIT de PostgreSQL solo añade latencia
+        "server_settings": {"jit": "off"},
+    }
+
 engine = create_async_engine(
     settings.DATABASE_URL,
     poolclass=AsyncAdaptedQueuePool,
@@ -12,6 +26,7 @@ engine = create_async_engine(
     pool_pre_ping=True,
     pool_recycle=settings.POOL_RECYCLE,
     echo=settings.SQLALCHEMY_ECHO,
+    connect_args=connect_args,
 )
 
 # NOMBRE CORRECTO que app.py espera
@@ -23,6 +38,32 @@ async_session_maker = async_sessionmaker(
 
 AsyncSessionLocal = async_session_maker  # Alias opcional
 
+
+async def warm_up_pool(size: int = settings.POOL_WARMUP):
+    """
+    Abre `size` conexiones a la vez y las devuelve al pool, para que la
+    primera ráfaga de peticiones no pague el connect/TLS
+    """
+    size = min(size, settings.POOL_SIZE)
+    if size <= 0:
+        return
+    # return_exceptions: si un connect falla, las conexiones abiertas se
+    # devuelven igualmente al pool en lugar de quedar fuera hasta el GC
+    results = await asyncio.gather(
+        *[engine.connect() for _ in range(size)], return_exceptions=True
+    )
+    connections = [result for result in results if isinstance(result, AsyncConnection)]
+    errors = [result for result in results if isinstance(result, BaseException)]
+    await asyncio.gather(*[conn.close() for conn in connections], return_exceptions=True)
+    
+    if errors:
+        logger.warning(
+            "⚠️  Pool de conexiones calentado parcialmente (%d/%d): %s",
+            len(connections), size, errors[0],
+        )
+    else:
+        logger.info("✅ Pool de conexiones calentado (%d conexiones)", size)
+
 async def get_async_db():
     async with async_session_maker() as session:
         try:
@@ -1,5 +1,6 @@
 # app/graphql/app.py - VERSIÓN OPTIMIZADA
 from typing import Any, Dict
+import asyncio
 import threading
 import traceback
 
@@ -8,18 +9,40 @@ from starlette.responses import PlainTextResponse, JSONResponse, HTMLResponse, R
 from starlette.routing import Route, Mount
 from starlette.requests import Request
 
-from app.db.sessions.async_session import async_session_maker
+from strawberry.asgi import GraphQL
 
-# Variables globales para la app GraphQL (creación lazy)
+from app.db.sessions.async_session import async_session_maker, warm_up_pool
+from app.graphql.dataloaders import CoordinatesLoader, ModelLoaders
+
+# Variables globales para la app GraphQL (creadas en el arranque)
 _schema = None
 _graphql_asgi = None
 _schema_lock = threading.Lock()
 _schema_created = False
 
+# Caché de respuestas derivadas del schema (inmutable tras su creación)
+_schema_sdl: bytes | None = None
+_schema_stats: Dict[str, Any] | None = None
+
+
+class SIPIGraphQL(GraphQL):
+    """GraphQL ASGI app con DataLoaders por petición en el contexto"""
+
+    async def get_context(self, request, response) -> Dict[str, Any]:
+        context = await super().get_context(request, response)
+        context["coords_loader"] = CoordinatesLoader()
+        db = getattr(request.state, "db", None)
+        if db is not None:
+            context["loaders"] = ModelLoaders(db)
+        return context
+
 
 def _create_graphql_assets():
     """
     Crea schema y GraphQL ASGI app de forma atómica (con lock).
+
+    Normalmente se ejecuta en el arranque (ver _build_schema_on_startup);
+    el lock queda como guarda defensiva si una petición llega antes.
     """
     global _schema, _graphql_asgi, _schema_created
 
@@ -32,11 +55,10 @@ def _create_graphql_assets():
 
         try:
             from app.graphql.schema import create_schema
-            from strawberry.asgi import GraphQL
 
-            print("[FIX] Creating schema GraphQL (lazy)...")
+            print("[FIX] Creating schema GraphQL...")
             _schema = create_schema()
-            _graphql_asgi = GraphQL(_schema, graphiql=True)
+            _graphql_asgi = SIPIGraphQL(_schema, graphiql=True)
             _schema_created = True
             print("OK Schema GraphQL created")
             return _schema, _graphql_asgi
@@ -46,6 +68,18 @@ def _create_graphql_assets():
             raise
 
 
+async def _build_schema_on_startup():
+    """
+    Construye el schema en un hilo durante el arranque para no bloquear
+    el event loop ni cargar el coste a la primera petición.
+    """
+    try:
+        await asyncio.to_thread(_create_graphql_assets)
+    except Exception:
+        # El error ya se ha registrado; las rutas lo reintentarán y lo reportarán
+        pass
+
+
 # Rutas
 async def docs_page(request: Request):
     return HTMLResponse("""
@@ -67,30 +101,8 @@ async def health(request: Request):
     return JSONResponse({"status": "ok", "service": "graphql"})
 
 
-async def export_schema(request: Request):
-    try:
-        schema, _ = _create_graphql_assets()
-    except Exception as e:
-        return PlainTextResponse(f"Error: {e}\n{traceback.format_exc()}", status_code=500)
-    
-    try:
-        if hasattr(schema, "as_str"):
-            return PlainTextResponse(schema.as_str())
-    except Exception:
-        pass
-    return PlainTextResponse(str(schema))
-
-
-async def schema_stats(request: Request):
-    """Endpoint de estadísticas del schema GraphQL"""
-    try:
-        schema, _ = _create_graphql_assets()
-    except Exception as e:
-        return JSONResponse({
-            "error": str(e),
-            "traceback": traceback.format_exc()
-        }, status_code=500)
-
+def _compute_schema_stats(schema) -> Dict[str, Any]:
+    """Calcula una única vez los contadores de tipos, queries y mutations"""
     # Obtener tipos del schema (Strawberry usa schema_converter)
     try:
         if hasattr(schema, 'schema_converter'):
@@ -116,12 +128,52 @@ async def schema_stats(request: Request):
     if hasattr(schema, 'mutation_type') and schema.mutation_type:
         mutations = getattr(schema.mutation_type, 'fields', {}) or getattr(schema.mutation_type, '_type_definition', {}).get('fields', {})
 
-    return JSONResponse({
+    return {
         "status": "ok",
         "types": num_types,
         "queries": len(queries) if isinstance(queries, (dict, list)) else 0,
         "mutations": len(mutations) if isinstance(mutations, (dict, list)) else 0,
-    })
+    }
+
+
+def _compute_schema_sdl(schema) -> bytes:
+    """Serializa el schema a SDL una única vez (ya codificado en UTF-8)"""
+    try:
+        if hasattr(schema, "as_str"):
+            return schema.as_str().encode("utf-8")
+    except Exception:
+        pass
+    return str(schema).encode("utf-8")
+
+
+async def export_schema(request: Request):
+    global _schema_sdl
+
+    try:
+        schema, _ = _create_graphql_assets()
+    except Exception as e:
+        return PlainTextResponse(f"Error: {e}\n{traceback.format_exc()}", status_code=500)
+    
+    if _schema_sdl is None:
+        _schema_sdl = _compute_schema_sdl(schema)
+    return PlainTextResponse(_schema_sdl)
+
+
+async def schema_stats(request: Request):
+    """Endpoint de estadísticas del schema GraphQL"""
+    global _schema_stats
+
+    try:
+        schema, _ = _create_graphql_assets()
+    except Exception as e:
+        return JSONResponse({
+            "error": str(e),
+            "traceback": traceback.format_exc()
+        }, status_code=500)
+
+    if _schema_stats is None:
+        _schema_stats = _compute_schema_stats(schema)
+    return JSONResponse(_schema_stats)
 
 
 # Wrapper para GraphQL
@@ -142,13 +194,17 @@ async def graphql_handler(scope, receive, send):
         })
         return
     
-    # Inyectar BD en scope
-    if scope["type"] == "http":
-        scope["state"] = scope.get("state", {})
-        scope["state"]["db"] = async_session_maker()
+    if scope["type"] != "http":
+        await graphql_app(scope, receive, send)
+        return
     
-    # Delegar a GraphQL
-    await graphql_app(scope, receive, send)
+    # Inyectar BD en scope; la sesión se cierra una sola vez al terminar la petición
+    async with async_session_maker() as session:
+        scope["state"] = scope.get("state", {})
+        scope["state"]["db"] = session
+        
+        # Delegar a GraphQL
+        await graphql_app(scope, receive, send)
 
 
 # App principal
@@ -159,7 +215,8 @@ application = Starlette(
         Route("/schema.graphql", export_schema),
         Route("/stats", schema_stats),
         Mount("/graphql", app=graphql_handler, name="graphql"),
-    ]
+    ],
+    on_startup=[_build_schema_on_startup, warm_up_pool],
 )
 
 print("OK Starlette app inicializada")
@@ -1,9 +1,21 @@
 """app/graphql/coordinates.py - Tipos y resolvers para coordenadas geográficas"""
+import logging
+import struct
 import strawberry
-from typing import Optional
+from functools import lru_cache
+from typing import Iterable, List, Optional, Tuple, Union
 from geoalchemy2 import WKBElement
 from geoalchemy2.shape import to_shape
 
+try:
+    import numpy as np
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+logger = logging.getLogger(__name__)
+
 
 @strawberry.type
 class Coordinates:
@@ -20,6 +32,36 @@ class Coordinates:
         return [self.latitude, self.longitude]
 
 
+# Flags EWKB de PostGIS en el campo de tipo
+_EWKB_SRID_FLAG = 0x20000000
+_EWKB_FLAGS_MASK = 0xE0000000
+_WKB_POINT = 1
+
+
+@lru_cache(maxsize=4096)
+def _parse_wkb(data: Union[str, bytes]) -> Tuple[float, float]:
+    """
+    Parsea (E)WKB -> (latitude, longitude). Cacheado por el propio WKB:
+    el mismo POINT repetido en una respuesta solo se decodifica una vez.
+    
+    Los POINT se leen directamente con struct (1 byte de orden + tipo
+    [+ SRID] + X, Y); el resto de geometrías pasan por Shapely.
+    """
+    raw = bytes.fromhex(data) if isinstance(data, str) else data
+    endian = '<' if raw[0] else '>'
+    (wkb_type,) = struct.unpack_from(endian + 'I', raw, 1)
+    
+    if wkb_type & ~_EWKB_FLAGS_MASK == _WKB_POINT:
+        offset = 9 if wkb_type & _EWKB_SRID_FLAG else 5
+        x, y = struct.unpack_from(endian + 'dd', raw, offset)
+    else:
+        shape = to_shape(WKBElement(data))
+        x, y = shape.x, shape.y
+    
+    # En PostGIS/GeoJSON: X = longitude, Y = latitude
+    return y, x
+
+
 def resolve_coordinates(geometry_value) -> Optional[Coordinates]:
     """
     Convierte un POINT de PostGIS a tipo Coordinates
@@ -42,7 +84,12 @@ def resolve_coordinates(geometry_value) -> Optional[Coordinates]:
         return None
     
     try:
-        # Convertir WKBElement (formato binario de PostGIS) a Shapely Point
+        if isinstance(geometry_value, WKBElement):
+            data = geometry_value.data
+            latitude, longitude = _parse_wkb(data if isinstance(data, str) else bytes(data))
+            return Coordinates(latitude=latitude, longitude=longitude)
+        
+        # Otros elementos (p. ej. WKTElement): convertir a Shapely Point
         shape = to_shape(geometry_value)
         
         # En PostGIS/GeoJSON: X = longitude, Y = latitude
@@ -51,10 +98,71 @@ def resolve_coordinates(geometry_value) -> Optional[Coordinates]:
             longitude=shape.x
         )
     except Exception as e:
-        print(f"⚠️  Error convirtiendo coordenadas: {e}")
+        logger.warning("⚠️  Error convirtiendo coordenadas: %s", e)
         return None
 
 
+# Por debajo de este tamaño de lote no compensa empaquetar para Numba
+_NUMBA_MIN_BATCH = 256
+# POINT 2D sin SRID: orden (1) + tipo (4) + X (8) + Y (8)
+_POINT_WKB_SIZE = 21
+
+if HAS_NUMBA:
+    @njit(cache=True, parallel=True)
+    def _decode_points(buf, out):
+        """Lee X, Y (doubles little-endian) de cada fila de 21 bytes -> (lat, lon)"""
+        for i in prange(buf.shape[0]):
+            x = buf[i, 5:13].copy().view(np.float64)[0]
+            y = buf[i, 13:21].copy().view(np.float64)[0]
+            out[i, 0] = y
+            out[i, 1] = x
+
+
+def _resolve_points_numba(values: List) -> List[Optional[Coordinates]]:
+    """
+    Empaqueta los POINT little-endian en una matriz (n, 21) de bytes
+    (descartando el SRID de EWKB) y los decodifica con _decode_points.
+    Lo que no sea un POINT así pasa por resolve_coordinates.
+    """
+    results: List[Optional[Coordinates]] = [None] * len(values)
+    rows = []
+    positions = []
+    
+    for i, value in enumerate(values):
+        if isinstance(value, WKBElement):
+            data = value.data
+            raw = bytes.fromhex(data) if isinstance(data, str) else bytes(data)
+            if raw[0] == 1:
+                (wkb_type,) = struct.unpack_from('<I', raw, 1)
+                if wkb_type & ~_EWKB_FLAGS_MASK == _WKB_POINT:
+                    offset = 9 if wkb_type & _EWKB_SRID_FLAG else 5
+                    rows.append(raw[:5] + raw[offset:offset + 16])
+                    positions.append(i)
+                    continue
+        results[i] = resolve_coordinates(value)
+    
+    if rows:
+        buf = np.frombuffer(b''.join(rows), dtype=np.uint8).reshape(-1, _POINT_WKB_SIZE)
+        out = np.empty((len(rows), 2), dtype=np.float64)
+        _decode_points(buf, out)
+        for i, (latitude, longitude) in zip(positions, out.tolist()):
+            results[i] = Coordinates(latitude=latitude, longitude=longitude)
+    
+    return results
+
+
+def resolve_coordinates_many(geometry_values: Iterable) -> List[Optional[Coordinates]]:
+    """
+    Versión por lotes de resolve_coordinates (usada por CoordinatesLoader):
+    una sola pasada sobre todos los POINT de la respuesta. Con Numba
+    instalado y lotes grandes, la decodificación se compila con @njit.
+    """
+    values = list(geometry_values)
+    if HAS_NUMBA and len(values) >= _NUMBA_MIN_BATCH:
+        return _resolve_points_numba(values)
+    return [resolve_coordinates(value) for value in values]
+
+
 @strawberry.input
 class CoordinatesInput:
     """
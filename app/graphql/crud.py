@@ -1,46 +1,150 @@
 # crud.py
 """CRUD Resolver with Advanced Filters"""
-from typing import Type, List, Optional, Any
+from typing import Type, List, Optional, Any, Dict, Callable
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, asc, desc
+from sqlalchemy import select, insert, update, delete, bindparam, func, asc, desc, inspect
 from sqlalchemy.exc import NoResultFound
+from sqlalchemy.orm import joinedload, selectinload
+from strawberry import UNSET
+from strawberry.types import Info
+from strawberry.utils.str_converters import to_camel_case
 from datetime import datetime, timezone  # ✅ IMPORT CORREGIDO
 from app.graphql.types import FilterInput, SortInput, PaginationInput, PaginatedResult, PageInfo
 
+# Operador de filtro -> constructor de la condición (column, value, values)
+FILTER_OPS: Dict[str, Callable[[Any, Any, list], Any]] = {
+    "eq": lambda c, v, vs: c == v,
+    "ne": lambda c, v, vs: c != v,
+    "gt": lambda c, v, vs: c > v,
+    "gte": lambda c, v, vs: c >= v,
+    "lt": lambda c, v, vs: c < v,
+    "lte": lambda c, v, vs: c <= v,
+    "like": lambda c, v, vs: c.like(f"%{v}%"),
+    "ilike": lambda c, v, vs: c.ilike(f"%{v}%"),
+    "in": lambda c, v, vs: c.in_(vs),
+    "not_in": lambda c, v, vs: c.not_in(vs),
+    "is_null": lambda c, v, vs: c.is_(None) if v else c.is_not(None),
+    "between": lambda c, v, vs: c.between(vs[0], vs[1]) if len(vs) == 2 else None,
+}
+
+# SELECT por id con parámetro enlazado, uno por modelo: misma SQL compilada
+# en cada llamada (caché de SQLAlchemy y sentencia preparada de asyncpg)
+_GET_STMT_CACHE: Dict[type, Any] = {}
+
+def _is_server_generated(column) -> bool:
+    """
+    True si la columna toma su valor en la base de datos: server_default /
+    server_onupdate o default/onupdate con expresión SQL (p. ej. func.now())
+    """
+    if column.server_default is not None or column.server_onupdate is not None:
+        return True
+    for default in (column.default, column.onupdate):
+        if default is not None and (default.is_clause_element or default.is_sequence):
+            return True
+    return False
+
+def _has_server_generated_values(model: Type) -> bool:
+    """
+    True si alguna columna (salvo la PK) se genera en la base de datos. Sin
+    ellas, tras el commit la instancia ya coincide con la fila y el refresh
+    es una consulta de más.
+    """
+    return any(
+        _is_server_generated(column)
+        for column in model.__table__.columns if not column.primary_key
+    )
+
 class CRUDResolver:
     def __init__(self, model: Type, mapper):
         self.model = model
         self.mapper = mapper
+        self._relationships: Optional[Dict[str, Any]] = None
+        self._needs_refresh = _has_server_generated_values(model)
+        # Soft delete: se decide una vez por modelo, no con hasattr en cada llamada
+        self._has_soft_delete = "deleted_at" in model.__table__.columns
+        # Columnas que el cliente puede asignar en create_many/update/update_many:
+        # ni la PK, ni las que genera la BD (created_at...), ni deleted_at
+        # (lo gestionan delete/restore)
+        self._writable_columns = frozenset(
+            column.key for column in model.__table__.columns
+            if not column.primary_key
+            and not _is_server_generated(column)
+            and column.key != "deleted_at"
+        )
+        self._unique_columns = {
+            column.key for column in model.__table__.columns
+            if column.primary_key or column.unique
+        }
     
-    async def get(self, session: AsyncSession, id: Any) -> Any:
-        stmt = select(self.model).where(self.model.id == id)
-        result = await session.execute(stmt)
-        instance = result.scalar_one_or_none()
+    async def get(self, session: AsyncSession, id: Any, info: Optional[Info] = None) -> Any:
+        options = self._eager_load_options(info)
+        loaders = info.context.get("loaders") if info is not None else None
+        
+        if loaders is not None and not options:
+            # Agrupa con el resto de get() de este modelo en la misma petición
+            instance = await loaders.for_model(self.model).load(id)
+        elif options:
+            stmt = select(self.model).where(self.model.id == id).options(*options)
+            result = await session.execute(stmt)
+            instance = result.scalar_one_or_none()
+        else:
+            result = await session.execute(self._get_stmt(), {"id": id})
+            instance = result.scalar_one_or_none()
         if not instance:
             raise NoResultFound(f"{self.model.__name__} con id {id} no encontrado")
         return instance
     
+    def _get_stmt(self):
+        stmt = _GET_STMT_CACHE.get(self.model)
+        if stmt is None:
+            stmt = _GET_STMT_CACHE.setdefault(
+                self.model,
+                select(self.model).where(self.model.id == bindparam("id")),
+            )
+        return stmt
+    
     async def list(self, session: AsyncSession,
                    filters: Optional[List[FilterInput]] = None,
                    sort: Optional[List[SortInput]] = None,
-                   pagination: Optional[PaginationInput] = None) -> PaginatedResult:
-        stmt = select(self.model)
+                   pagination: Optional[PaginationInput] = None,
+                   info: Optional[Info] = None) -> PaginatedResult:
+        base_stmt = select(self.model)
         
         if filters:
-            stmt = self._apply_filters(stmt, filters)
-        
-        count_stmt = select(func.count()).select_from(stmt.subquery())
-        total = await session.scalar(count_stmt) or 0
-        
-        if sort:
-            stmt = self._apply_sort(stmt, sort)
+            base_stmt = self._apply_filters(base_stmt, filters)
         
         page = pagination.page if pagination else 1
         page_size = pagination.page_size if pagination else 20
-        stmt = stmt.offset((page - 1) * page_size).limit(page_size)
+        eager_options = self._eager_load_options(info, nested_in="items")
         
-        result = await session.execute(stmt)
-        items = list(result.scalars().all())
+        if filters and self._is_single_row_filter(filters):
+            # eq sobre PK/columna única: como mucho una fila, sin ventana ni offset
+            result = await session.execute(base_stmt.limit(1).options(*eager_options))
+            found = result.scalars().all()
+            total = len(found)
+            items = found if page == 1 else []
+        else:
+            # Total vía función ventana: una sola ida y vuelta a la BD (count + página)
+            stmt = base_stmt.add_columns(func.count().over().label("total"))
+            
+            if sort:
+                stmt = self._apply_sort(stmt, sort)
+            
+            stmt = stmt.offset((page - 1) * page_size).limit(page_size)
+            stmt = stmt.options(*eager_options)
+            
+            result = await session.execute(stmt)
+            rows = result.all()
+            items = [row[0] for row in rows]
+            
+            if rows:
+                total = rows[0][1]
+            elif page > 1:
+                # Página fuera de rango: la ventana no devuelve filas, contar aparte
+                count_stmt = select(func.count()).select_from(base_stmt.subquery())
+                total = await session.scalar(count_stmt) or 0
+            else:
+                total = 0
         
         total_pages = (total + page_size - 1) // page_size
         
@@ -50,46 +154,67 @@ class CRUDResolver:
                 page=page, page_size=page_size, total=total,
                 total_pages=total_pages,
                 has_next=page < total_pages,
-                has_prev=page > 1
+                has_previous=page > 1
             )
         )
     
+    def _is_single_row_filter(self, filters: List[FilterInput]) -> bool:
+        """True si algún filtro es igualdad sobre la PK o una columna única"""
+        for f in filters:
+            op = f.operator.value if hasattr(f.operator, 'value') else f.operator
+            if op == "eq" and f.value is not None and f.field in self._unique_columns:
+                return True
+        return False
+    
+    def _eager_load_options(self, info: Optional[Info], nested_in: Optional[str] = None) -> list:
+        """
+        Opciones de carga eager para las relaciones pedidas en la query GraphQL.
+        joinedload para many-to-one y selectinload para colecciones (evita N+1).
+        """
+        if info is None or not info.selected_fields:
+            return []
+        
+        if self._relationships is None:
+            self._relationships = {
+                to_camel_case(rel.key): rel for rel in inspect(self.model).relationships
+            }
+        
+        selections = info.selected_fields[0].selections
+        if nested_in:
+            # En listados las relaciones cuelgan del campo de items paginados
+            selections = [
+                child
+                for sel in selections if getattr(sel, "name", None) == nested_in
+                for child in sel.selections
+            ]
+        
+        options = []
+        for sel in selections:
+            rel = self._relationships.get(getattr(sel, "name", None))
+            if rel is None:
+                continue
+            attr = getattr(self.model, rel.key)
+            options.append(selectinload(attr) if rel.uselist else joinedload(attr))
+        return options
+    
     def _apply_filters(self, stmt, filters: List[FilterInput]):
+        conditions = []
         for f in filters:
             column = getattr(self.model, f.field, None)
             if not column:
                 continue
             
             op = f.operator.value if hasattr(f.operator, 'value') else f.operator
-            value = f.value
-            values = f.values or []
+            build = FILTER_OPS.get(op)
+            if build is None:
+                continue
             
-            if op == "eq":
-                stmt = stmt.where(column == value)
-            elif op == "ne":
-                stmt = stmt.where(column != value)
-            elif op == "gt":
-                stmt = stmt.where(column > value)
-            elif op == "gte":
-                stmt = stmt.where(column >= value)
-            elif op == "lt":
-                stmt = stmt.where(column < value)
-            elif op == "lte":
-                stmt = stmt.where(column <= value)
-            elif op == "like":
-                stmt = stmt.where(column.like(f"%{value}%"))
-            elif op == "ilike":
-                stmt = stmt.where(column.ilike(f"%{value}%"))
-            elif op == "in":
-                stmt = stmt.where(column.in_(values))
-            elif op == "not_in":
-                stmt = stmt.where(column.not_in(values))
-            elif op == "is_null":
-                stmt = stmt.where(column.is_(None) if value else column.is_not(None))
-            elif op == "between" and len(values) == 2:
-                stmt = stmt.where(column.between(values[0], values[1]))
+            condition = build(column, f.value, f.values or [])
+            if condition is not None:
+                conditions.append(condition)
         
-        return stmt
+        # Un único where() con todas las condiciones (AND)
+        return stmt.where(*conditions) if conditions else stmt
     
     def _apply_sort(self, stmt, sort: List[SortInput]):
         for s in sort:
@@ -108,32 +233,39 @@ class CRUDResolver:
         instance = self.model(**data)
         session.add(instance)
         await session.commit()
-        await session.refresh(instance)
+        await self._refresh_if_needed(session, instance)
         return instance
     
+    async def _refresh_if_needed(self, session: AsyncSession, instance: Any):
+        if not self._needs_refresh:
+            return
+        # Solo lo que no se trajo ya con RETURNING (eager_defaults)
+        expired = inspect(instance).expired_attributes
+        if expired:
+            await session.refresh(instance, attribute_names=list(expired))
+    
     async def update(self, session: AsyncSession, id: Any, data: dict) -> Any:
-        stmt = select(self.model).where(self.model.id == id)
-        result = await session.execute(stmt)
+        result = await session.execute(self._get_stmt(), {"id": id})
         instance = result.scalar_one_or_none()
         if not instance:
             raise NoResultFound(f"{self.model.__name__} con id {id} no encontrado")
         
+        writable = self._writable_columns
         for key, value in data.items():
-            if hasattr(instance, key) and value is not None:
+            if key in writable and value is not None and value is not UNSET:
                 setattr(instance, key, value)
         
         await session.commit()
-        await session.refresh(instance)
+        await self._refresh_if_needed(session, instance)
         return instance
     
     async def delete(self, session: AsyncSession, id: Any) -> bool:
-        stmt = select(self.model).where(self.model.id == id)
-        result = await session.execute(stmt)
+        result = await session.execute(self._get_stmt(), {"id": id})
         instance = result.scalar_one_or_none()
         if not instance:
             return False
         
-        if hasattr(instance, 'deleted_at'):
+        if self._has_soft_delete:
             instance.deleted_at = datetime.now(timezone.utc)  # ✅ CORREGIDO
         else:
             # ✅ CORREGIDO: await necesario en SQLAlchemy 2.0+
@@ -142,17 +274,80 @@ class CRUDResolver:
         await session.commit()
         return True
     
+    async def create_many(self, session: AsyncSession, rows: List[dict]) -> List[Any]:
+        """
+        Inserta todas las filas en una sola transacción (executemany). Solo se
+        insertan las columnas asignables: la PK y los timestamps los genera
+        el modelo o la BD, igual que en update_many
+        """
+        writable = self._writable_columns
+        rows = [
+            {key: value for key, value in row.items() if key in writable and value is not UNSET}
+            for row in rows
+        ]
+        if not rows:
+            return []
+        result = await session.execute(insert(self.model).returning(self.model), rows)
+        instances = result.scalars().all()
+        await session.commit()
+        return instances
+    
+    async def update_many(self, session: AsyncSession, rows: List[dict]) -> List[Any]:
+        """
+        Actualiza por clave primaria: cada fila lleva su 'id' y los campos
+        a cambiar (los None/UNSET y las claves que no son columnas asignables
+        se ignoran, igual que en update)
+        """
+        allowed = self._writable_columns | {"id"}
+        rows = [
+            {
+                key: value for key, value in row.items()
+                if key in allowed and value is not None and value is not UNSET
+            }
+            for row in rows
+        ]
+        # Sin 'id' no hay fila que actualizar; solo con 'id' no hay nada que cambiar
+        rows = [row for row in rows if row.get("id") is not None and len(row) > 1]
+        if not rows:
+            return []
+        
+        await session.execute(update(self.model), rows)
+        await session.commit()
+        
+        ids = [row["id"] for row in rows]
+        result = await session.execute(select(self.model).where(self.model.id.in_(ids)))
+        return result.scalars().all()
+    
+    async def delete_many(self, session: AsyncSession, ids: List[Any]) -> int:
+        """Borra (o marca deleted_at) todos los ids en una sola sentencia"""
+        if not ids:
+            return 0
+        
+        if self._has_soft_delete:
+            stmt = (
+                update(self.model)
+                .where(self.model.id.in_(ids))
+                # Las ya borradas no se vuelven a marcar ni cuentan en el total
+                .where(self.model.deleted_at.is_(None))
+                .values(deleted_at=datetime.now(timezone.utc))
+            )
+        else:
+            stmt = delete(self.model).where(self.model.id.in_(ids))
+        
+        result = await session.execute(stmt)
+        await session.commit()
+        return result.rowcount
+    
     async def restore(self, session: AsyncSession, id: Any) -> Optional[Any]:
-        if not hasattr(self.model, 'deleted_at'):
+        if not self._has_soft_delete:
             return None
         
-        stmt = select(self.model).where(self.model.id == id)
-        result = await session.execute(stmt)
+        result = await session.execute(self._get_stmt(), {"id": id})
         instance = result.scalar_one_or_none()
         if not instance or not instance.deleted_at:
             return None
         
         instance.deleted_at = None
         await session.commit()
-        await session.refresh(instance)
+        await self._refresh_if_needed(session, instance)
         return instance
\ No newline at end of file
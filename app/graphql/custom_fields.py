@@ -2,10 +2,15 @@
 app/graphql/custom_fields.py
 Funciones helper para detectar y manejar campos geometry/geography en modelos SQLAlchemy
 """
+import logging
+from functools import lru_cache
 from typing import Any, List, Tuple, Optional
 import strawberry
+from geoalchemy2 import Geometry, Geography
 from geoalchemy2.shape import to_shape
 
+logger = logging.getLogger(__name__)
+
 # ============================================================
 # TIPO PARA COORDENADAS
 # ============================================================
@@ -27,7 +32,7 @@ def resolve_coordinates(geom) -> Optional[Coordinates]:
         point = to_shape(geom)
         return Coordinates(lat=point.y, lon=point.x)
     except Exception as e:
-        print(f"⚠️  Error convirtiendo coordenadas: {e}")
+        logger.warning("⚠️  Error convirtiendo coordenadas: %s", e)
         return None
 
 
@@ -35,34 +40,32 @@ def resolve_coordinates(geom) -> Optional[Coordinates]:
 # DETECCIÓN DE CAMPOS GEOMETRY
 # ============================================================
 
+@lru_cache(maxsize=None)
+def _geometry_column_names(model: Any) -> Tuple[str, ...]:
+    """
+    Nombres de las columnas geometry/geography del modelo, en una sola pasada.
+    Los modelos no cambian en tiempo de ejecución: se calcula una vez por clase.
+    """
+    if not hasattr(model, "__table__"):
+        return ()
+    return tuple(
+        col.name for col in model.__table__.columns
+        if isinstance(col.type, (Geometry, Geography))
+    )
+
+
 def detect_custom_fields(model: Any) -> bool:
     """
     Detecta si un modelo tiene columnas geometry/geography
     """
-    if not hasattr(model, "__table__"):
-        return False
-    
-    for col in model.__table__.columns:
-        col_type_str = str(col.type).lower()
-        if 'geometry' in col_type_str or 'geography' in col_type_str:
-            return True
-    return False
+    return bool(_geometry_column_names(model))
 
 
 def get_excluded_field_names_for_model(model: Any) -> List[str]:
     """
     Retorna lista de nombres de campos geometry/geography que deben excluirse
     """
-    excluded = []
-    if not hasattr(model, "__table__"):
-        return excluded
-    
-    for col in model.__table__.columns:
-        col_type_str = str(col.type).lower()
-        if 'geometry' in col_type_str or 'geography' in col_type_str:
-            excluded.append(col.name)
-    
-    return excluded
+    return list(_geometry_column_names(model))
 
 
 # ============================================================
@@ -76,7 +79,7 @@ def create_type_with_custom_fields(mapper_instance, model: Any, name: str) -> Tu
     Returns:
         (tipo_creado, lista_de_campos_excluidos)
     """
-    excluded_fields = get_excluded_field_names_for_model(model)
+    excluded_fields = list(_geometry_column_names(model))
     
     if excluded_fields:
         # Usar mapper con exclude
@@ -0,0 +1,56 @@
+"""app/graphql/dataloaders.py - DataLoaders por petición para agrupar lecturas por id"""
+from typing import Any, Dict, List, Type
+
+from aiodataloader import DataLoader
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.graphql.coordinates import resolve_coordinates_many
+
+
+class ModelLoader(DataLoader):
+    """
+    Agrupa los get-by-id de un modelo dentro del mismo tick del event loop
+    en una única SELECT ... WHERE id IN (...)
+    """
+    
+    def __init__(self, session: AsyncSession, model: Type):
+        super().__init__()
+        self.session = session
+        self.model = model
+    
+    async def batch_load_fn(self, ids: List[Any]) -> List[Any]:
+        stmt = select(self.model).where(self.model.id.in_(ids))
+        result = await self.session.execute(stmt)
+        by_id = {instance.id: instance for instance in result.scalars().all()}
+        return [by_id.get(id) for id in ids]
+
+
+class ModelLoaders:
+    """Registro de ModelLoader por modelo; se crea uno por petición GraphQL"""
+    
+    def __init__(self, session: AsyncSession):
+        self.session = session
+        self._loaders: Dict[Type, ModelLoader] = {}
+    
+    def for_model(self, model: Type) -> ModelLoader:
+        loader = self._loaders.get(model)
+        if loader is None:
+            loader = self._loaders[model] = ModelLoader(self.session, model)
+        return loader
+
+
+def _geometry_cache_key(geometry_value: Any) -> Any:
+    """Clave hashable para un WKBElement: su WKB (bytes o hex)"""
+    data = getattr(geometry_value, "data", geometry_value)
+    return data if isinstance(data, (str, bytes)) else bytes(data)
+
+
+class CoordinatesLoader(DataLoader):
+    """Resuelve en lote los campos geometry -> Coordinates de una petición"""
+    
+    def __init__(self):
+        super().__init__(get_cache_key=_geometry_cache_key)
+    
+    async def batch_load_fn(self, geometry_values: List[Any]) -> List[Any]:
+        return resolve_coordinates_many(geometry_values)
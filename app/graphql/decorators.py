@@ -1,12 +1,20 @@
 """Resolver Decorators"""
+import logging
 from functools import wraps
 
+logger = logging.getLogger(__name__)
+
 def async_safe_resolver(func):
+    # Ya envuelto: no añadir otro frame por llamada
+    if getattr(func, "__async_safe__", False):
+        return func
+    
     @wraps(func)
     async def wrapper(*args, **kwargs):
         try:
             return await func(*args, **kwargs)
         except Exception as e:
-            print(f"[Resolver Error] {func.__name__}: {e}")
+            logger.warning("[Resolver Error] %s: %s", func.__name__, e)
             return None
-    return wrapper
+    wrapper.__async_safe__ = True
+    return wrapper
\ No newline at end of file
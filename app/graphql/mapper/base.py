@@ -1,6 +1,15 @@
 # app/graphql/mapper/base.py
 """Main SQLAlchemy to Strawberry mapper with library integration"""
-from typing import Type
+from typing import Dict, Optional, Set, Tuple, Type
+from datetime import datetime, date
+from decimal import Decimal
+import enum
+import uuid
+
+import strawberry
+from strawberry.scalars import JSON
+from sqlalchemy.inspection import inspect
+from sqlalchemy.dialects.postgresql import JSONB
 
 try:
     from strawberry_sqlalchemy_mapper import StrawberrySQLAlchemyMapper
@@ -23,6 +32,15 @@ class SQLAlchemyMapper:
         self.cache = TypeCache()
         self.property_extractor = PropertyExtractor()
         self.type_builder = TypeBuilder()
+        # (model, for_input, prefix, optional) -> campos de _fallback_map_columns
+        self._fallback_cache: Dict[Tuple[Type, bool, str, bool], Dict[str, Type]] = {}
+        # (key sanitizada, tipo strawberry o None si no tiene python_type, nullable, primary_key) por columna
+        self._model_columns: Dict[Type, Tuple[Tuple[str, Optional[Type], bool, bool], ...]] = {}
+        # Campos del tipo de la librería y @property, con las claves ya sanitizadas
+        self._library_fields: Dict[Type, Dict[str, Type]] = {}
+        self._model_properties: Dict[Type, Dict[str, Type]] = {}
+        # Modelos para los que la librería no pudo crear input types: no se reintenta
+        self._no_library_input: Set[Type] = set()
         
         if HAS_LIBRARY:
             try:
@@ -42,14 +60,19 @@ class SQLAlchemyMapper:
         if self.cache.has_type(model_name):
             return self.cache.get_type(model_name)
         
+        with self.cache.lock:
+            # Otro hilo pudo construirlo mientras esperábamos el lock
+            if self.cache.has_type(model_name):
+                return self.cache.get_type(model_name)
+            return self._build_type(model, model_name)
+    
+    def _build_type(self, model: Type, model_name: str) -> Type:
         fields = {}
         
         # 1. Obtener campos base de la librería
         if self.base_mapper:
             try:
-                base_type = self.base_mapper.type(model)
-                if hasattr(base_type, '__annotations__'):
-                    fields = base_type.__annotations__.copy()
+                fields = self._library_type_fields(model)
             except Exception as e:
                 print(f"  ⚠️  Librería falló para {model_name}: {e}")
                 fields = self._fallback_map_columns(model)
@@ -58,78 +81,114 @@ class SQLAlchemyMapper:
         
         # 2. Añadir propiedades calculadas
         try:
-            properties = self.property_extractor.extract(model)
+            properties = self._properties(model)
             if properties:
                 fields.update(properties)
         except Exception as e:
             print(f"  ⚠️  Error extrayendo propiedades de {model_name}: {e}")
         
-        # 3. Construir tipo
-        strawberry_type = self.type_builder.build_type(model_name, fields)
+        # 3. Construir tipo (todas las claves vienen ya sanitizadas)
+        strawberry_type = self.type_builder.build_type(model_name, fields, sanitize=False)
         self.cache.set_type(model_name, strawberry_type)
         
         return strawberry_type
     
     def input_type(self, model: Type, prefix: str = "", optional: bool = False) -> Type:
         """Crea InputType para crear/actualizar"""
-        if self.base_mapper:
+        if self.base_mapper and model not in self._no_library_input:
             try:
                 return self.base_mapper.input_type(model, prefix, optional)
-            except:
-                pass
+            except Exception as e:
+                print(f"  ⚠️  Librería sin input type para {model.__name__}: {e}")
+                self._no_library_input.add(model)
         
         fields = self._fallback_map_columns(model, for_input=True, prefix=prefix, optional=optional)
         type_name = f"{model.__name__}{prefix}Input"
-        return self.type_builder.build_input_type(type_name, fields)
+        # Las claves ya vienen sanitizadas de _columns
+        return self.type_builder.build_input_type(type_name, fields, sanitize=False)
     
     def _fallback_map_columns(self, model: Type, for_input: bool = False, prefix: str = "", optional: bool = False):
         """Mapeo básico de columnas como fallback"""
-        from sqlalchemy.inspection import inspect
-        from sqlalchemy.dialects.postgresql import JSONB
-        from strawberry.scalars import JSON
-        from typing import Optional as Opt
-        from datetime import datetime, date
-        from decimal import Decimal
-        import strawberry
-        import uuid
-        import enum
-        
-        mapper = inspect(model)
-        fields = {}
+        key = (model, for_input, prefix, optional)
+        fields = self._fallback_cache.get(key)
+        if fields is None:
+            fields = self._fallback_cache[key] = self._map_columns(model, for_input, prefix, optional)
+        # Copia: type() añade las propiedades sobre el resultado
+        return dict(fields)
+    
+    def _library_type_fields(self, model: Type) -> Dict[str, Type]:
+        """Anotaciones del tipo de la librería, sanitizadas una vez por modelo"""
+        fields = self._library_fields.get(model)
+        if fields is None:
+            base_type = self.base_mapper.type(model)
+            fields = self._library_fields[model] = self.type_builder.sanitize_fields(
+                dict(getattr(base_type, '__annotations__', {}))
+            )
+        # Copia: type() añade las propiedades sobre el resultado
+        return dict(fields)
+    
+    def _properties(self, model: Type) -> Dict[str, Type]:
+        """@property del modelo (PropertyExtractor), sanitizadas una vez por modelo"""
+        properties = self._model_properties.get(model)
+        if properties is None:
+            properties = self._model_properties[model] = self.type_builder.sanitize_fields(
+                self.property_extractor.extract(model)
+            )
+        return properties
+    
+    def _columns(self, model: Type) -> Tuple[Tuple[str, Optional[Type], bool, bool], ...]:
+        """Descriptor de columnas del modelo: una sola introspección (y sanitización) por modelo"""
+        columns = self._model_columns.get(model)
+        if columns is not None:
+            return columns
         
-        for attr in mapper.attrs:
+        columns = []
+        for attr in inspect(model).attrs:
             if hasattr(attr, 'columns'):
                 column = attr.columns[0]
                 
-                if for_input and column.primary_key and prefix.lower() == "create":
-                    continue
-                
                 if isinstance(column.type, JSONB):
                     field_type = JSON
-                    if column.nullable or optional:
-                        field_type = Opt[JSON]
-                    fields[attr.key] = field_type
-                    continue
+                elif (python_type := _python_type(column.type)) is None:
+                    # Tipos sin python_type (p. ej. Geometry de PostGIS)
+                    field_type = None
+                elif isinstance(python_type, type) and issubclass(python_type, enum.Enum):
+                    field_type = python_type
+                elif python_type == uuid.UUID:
+                    field_type = strawberry.ID
+                elif python_type == Decimal:
+                    field_type = float
+                elif python_type == dict:
+                    field_type = JSON
+                else:
+                    field_type = python_type
                 
-                try:
-                    python_type = column.type.python_type
-                    
-                    if isinstance(python_type, type) and issubclass(python_type, enum.Enum):
-                        field_type = python_type
-                    elif python_type == uuid.UUID:
-                        field_type = strawberry.ID
-                    elif python_type == Decimal:
-                        field_type = float
-                    elif python_type == dict:
-                        field_type = JSON
-                    else:
-                        field_type = python_type
-                    
-                    if column.nullable or optional:
-                        field_type = Opt[field_type]
-                    
-                    fields[attr.key] = field_type
-                except:
-                    fields[attr.key] = Opt[str]
+                columns.append((self.type_builder.sanitize_field_name(attr.key), field_type, bool(column.nullable), bool(column.primary_key)))
+        
+        columns = self._model_columns[model] = tuple(columns)
+        return columns
+    
+    def _map_columns(self, model: Type, for_input: bool, prefix: str, optional: bool) -> Dict[str, Type]:
+        fields = {}
+        skip_pk = for_input and prefix.lower() == "create"
+        
+        for key, field_type, nullable, primary_key in self._columns(model):
+            if primary_key and skip_pk:
+                continue
+            
+            if field_type is None:
+                fields[key] = Optional[str]
+            elif nullable or optional:
+                fields[key] = Optional[field_type]
+            else:
+                fields[key] = field_type
         
-        return fields
\ No newline at end of file
+        return fields
+
+
+def _python_type(column_type) -> Optional[type]:
+    """python_type del tipo de columna, o None si el tipo no lo implementa"""
+    try:
+        return column_type.python_type
+    except NotImplementedError:
+        return None
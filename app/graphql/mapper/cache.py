@@ -1,5 +1,6 @@
 # app/graphql/mapper/cache.py
 """Cache management for type conversions"""
+import threading
 from typing import Dict, Type
 
 class TypeCache:
@@ -7,6 +8,9 @@ class TypeCache:
     
     def __init__(self):
         self._type_cache: Dict[str, Type] = {}
+        # Serializa la construcción de tipos (reentrante: un tipo puede
+        # construir otros mientras lo tiene)
+        self.lock = threading.RLock()
     
     def get_type(self, model_name: str) -> Type | None:
         return self._type_cache.get(model_name)
@@ -1,18 +1,36 @@
 # app/graphql/mapper/enhanced_mapper.py
 """Enhanced SQLAlchemy to Strawberry Mapper"""
-from typing import Type, Dict, Any, Callable, List, Optional, get_origin, get_args
+import threading
+from typing import Type, Dict, List, Optional, Tuple
 import strawberry
-from strawberry.types import Info
 from sqlalchemy.inspection import inspect
 from datetime import datetime, date
 from decimal import Decimal
 import enum
 import uuid
 
+from .property_extractor import PropertyExtractor
+
+# Tipo Python de la columna -> tipo Strawberry (enums aparte, el resto str)
+_PYTHON_TO_STRAWBERRY = {
+    int: int,
+    str: str,
+    float: float,
+    bool: bool,
+    datetime: datetime,
+    date: date,
+    Decimal: float,
+    uuid.UUID: strawberry.ID,
+}
+
 class EnhancedSQLAlchemyMapper:
     def __init__(self):
-        self._model_properties: Dict[str, Dict[str, Any]] = {}
+        self._property_extractor = PropertyExtractor()
         self._type_cache: Dict[str, Type] = {}
+        self._input_cache: Dict[Tuple[str, str, bool], Type] = {}
+        self._type_lock = threading.RLock()
+        # (key, tipo strawberry, nullable, primary_key, tiene default) por columna
+        self._column_info: Dict[Type, List[Tuple[str, Type, bool, bool, bool]]] = {}
     
     def type(self, model: Type) -> Type:
         """Convierte un modelo SQLAlchemy a tipo Strawberry"""
@@ -22,26 +40,19 @@ class EnhancedSQLAlchemyMapper:
         if model_name in self._type_cache:
             return self._type_cache[model_name]
         
-        # Obtener mapper de SQLAlchemy
-        mapper = inspect(model)
-        fields = {}
-        
+        with self._type_lock:
+            # Otro hilo pudo construirlo mientras esperábamos el lock
+            if model_name in self._type_cache:
+                return self._type_cache[model_name]
+            return self._build_type(model, model_name)
+    
+    def _build_type(self, model: Type, model_name: str) -> Type:
         # Mapear columnas
-        for attr in mapper.attrs:
-            if hasattr(attr, 'columns'):
-                column = attr.columns[0]
-                
-                try:
-                    python_type = column.type.python_type
-                    field_type = self._python_to_strawberry(python_type)
-                except (AttributeError, NotImplementedError):
-                    # Tipos PostGIS sin python_type
-                    field_type = str
-                
-                if column.nullable:
-                    field_type = Optional[field_type]
-                
-                fields[attr.key] = field_type
+        fields = {}
+        for key, field_type, nullable, _, _ in self._get_column_info(model):
+            if nullable:
+                field_type = Optional[field_type]
+            fields[key] = field_type
         
         # Añadir propiedades mapeables
         properties = self._extract_properties(model)
@@ -58,149 +69,68 @@ class EnhancedSQLAlchemyMapper:
     
     def input_type(self, model: Type, prefix: str = "", optional: bool = False) -> Type:
         """Crea InputType para crear/actualizar"""
-        mapper = inspect(model)
+        key = (model.__name__, prefix, optional)
+        input_type = self._input_cache.get(key)
+        if input_type is None:
+            input_type = self._input_cache[key] = self._build_input_type(model, prefix, optional)
+        return input_type
+    
+    def _build_input_type(self, model: Type, prefix: str, optional: bool) -> Type:
         fields = {}
+        is_create = prefix.lower() == "create"
+        
+        for key, field_type, nullable, primary_key, has_default in self._get_column_info(model):
+            # Skip primary keys en Create
+            if primary_key and is_create:
+                continue
+            
+            if optional or nullable or has_default:
+                field_type = Optional[field_type]
+            
+            fields[key] = field_type
         
-        for attr in mapper.attrs:
+        type_name = f"{model.__name__}{prefix}Input"
+        return strawberry.input(type(type_name, (), {"__annotations__": fields}))
+    
+    def _get_column_info(self, model: Type) -> List[Tuple[str, Type, bool, bool, bool]]:
+        """Descriptor de columnas del modelo, calculado una vez y compartido por type/input_type"""
+        column_info = self._column_info.get(model)
+        if column_info is not None:
+            return column_info
+        
+        column_info = []
+        for attr in inspect(model).attrs:
             if hasattr(attr, 'columns'):
                 column = attr.columns[0]
                 
-                # Skip primary keys en Create
-                if column.primary_key and prefix.lower() == "create":
-                    continue
-                
                 try:
                     python_type = column.type.python_type
                     field_type = self._python_to_strawberry(python_type)
                 except (AttributeError, NotImplementedError):
+                    # Tipos PostGIS sin python_type
                     field_type = str
                 
-                if optional or column.nullable or column.default is not None:
-                    field_type = Optional[field_type]
-                
-                fields[attr.key] = field_type
-        
-        type_name = f"{model.__name__}{prefix}Input"
-        return strawberry.input(type(type_name, (), {"__annotations__": fields}))
+                column_info.append((
+                    attr.key,
+                    field_type,
+                    bool(column.nullable),
+                    bool(column.primary_key),
+                    column.default is not None,
+                ))
+        
+        self._column_info[model] = column_info
+        return column_info
     
     def _extract_properties(self, model: Type) -> Dict[str, Type]:
-        """Extrae propiedades y métodos del modelo"""
-        properties = {}
-        
-        # ✅ SOLO ignorar metadata de SQLAlchemy
-        ignored_properties = {'metadata', 'registry'}
-        
-        for attr_name in dir(model):
-            if attr_name.startswith('_'):
-                continue
-            
-            if attr_name in ignored_properties:
-                continue
-            
-            try:
-                attr = getattr(model, attr_name)
-                
-                if isinstance(attr, property):
-                    ret_type = self._infer_return_type(attr)
-                    # ✅ Si retorna None, ignorar esta propiedad (tipo complejo no mapeable)
-                    if ret_type is not None:
-                        properties[attr_name] = ret_type
-                    
-            except Exception:
-                continue
-        
-        return properties
+        """Extrae propiedades mapeables del modelo (PropertyExtractor, cacheado por modelo)"""
+        return self._property_extractor.extract(model)
     
-    def _infer_return_type(self, attr: Any) -> Optional[Type]:
-        """Infiere el tipo de retorno de una propiedad/método. Retorna None si no es mapeable."""
-        try:
-            func = attr.fget if isinstance(attr, property) else attr
-            
-            # ✅ Si tiene anotación, analizarla
-            if hasattr(func, '__annotations__') and 'return' in func.__annotations__:
-                ann = func.__annotations__['return']
-                
-                # ✅ Detectar tipos complejos no mapeables
-                ann_str = str(ann)
-                
-                # Ignorar list[Model], List[Model], etc.
-                if 'list[' in ann_str.lower() or 'List[' in ann_str:
-                    # Verificar si es list de tipos primitivos o de modelos
-                    origin = get_origin(ann)
-                    if origin is list or origin is List:
-                        args = get_args(ann)
-                        if args:
-                            # Si el argumento no es un tipo primitivo, ignorar
-                            arg_type = args[0]
-                            if not self._is_primitive_type(arg_type):
-                                return None  # ✅ Ignorar list[Model]
-                
-                # Tipos válidos
-                if ann in (str, int, float, bool, datetime, date):
-                    return ann
-                
-                # Optional[str], Optional[int], etc.
-                if get_origin(ann) is type(Optional):
-                    args = get_args(ann)
-                    if args and self._is_primitive_type(args[0]):
-                        return ann
-                
-                return ann  # Confiar en otros tipos anotados
-            
-            # ✅ Inferir por nombre (sin anotación)
-            name = getattr(func, '__name__', '').lower()
-            
-            if name.startswith(('is_', 'has_', 'tiene_', 'esta_')):
-                return bool
-            
-            if 'count' in name or 'total' in name:
-                return int
-            
-            # Para propiedades complejas sin anotación
-            if name.endswith(('_list', '_items', '_all')):
-                return None  # Ignorar
-            
-            if 'actual' in name or 'current' in name or 'principal' in name:
-                return Optional[str]
-            
-            return str
-        except:
-            return str
-    
-    def _is_primitive_type(self, t: Type) -> bool:
-        """Verifica si un tipo es primitivo/básico"""
-        primitives = (str, int, float, bool, datetime, date, Decimal, type(None))
-        
-        # Tipo directo
-        if t in primitives:
-            return True
-        
-        # Enum
-        if isinstance(t, type) and issubclass(t, enum.Enum):
-            return True
-        
-        # Tipos genéricos como Optional[str]
-        origin = get_origin(t)
-        if origin is type(Optional):
-            args = get_args(t)
-            return args and args[0] in primitives
-        
-        return False
-    
-    def _python_to_strawberry(self, py_type: Type) -> Type:
+    @staticmethod
+    def _python_to_strawberry(py_type: Type) -> Type:
         """Convierte tipos Python a tipos Strawberry"""
+        strawberry_type = _PYTHON_TO_STRAWBERRY.get(py_type)
+        if strawberry_type is not None:
+            return strawberry_type
         if isinstance(py_type, type) and issubclass(py_type, enum.Enum):
             return py_type
-        if py_type == uuid.UUID:
-            return strawberry.ID
-        
-        mapping = {
-            int: int,
-            str: str,
-            float: float,
-            bool: bool,
-            datetime: datetime,
-            date: date,
-            Decimal: float,
-        }
-        return mapping.get(py_type, str)
\ No newline at end of file
+        return str
\ No newline at end of file
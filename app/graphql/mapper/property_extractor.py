@@ -10,28 +10,33 @@ class PropertyExtractor:
     def __init__(self):
         self.inferencer = TypeInferencer()
         self.ignored_properties = {'metadata', 'registry'}
+        self._cache: Dict[Type, Dict[str, Type]] = {}
     
     def extract(self, model: Type) -> Dict[str, Type]:
-        """Extrae propiedades mapeables del modelo"""
+        """Extrae propiedades mapeables del modelo (cacheado por modelo)"""
+        properties = self._cache.get(model)
+        if properties is not None:
+            return properties
+        
         properties = {}
         
-        for attr_name in dir(model):
-            if attr_name.startswith('_'):
-                continue
-            
-            if attr_name in self.ignored_properties:
-                continue
-            
-            try:
-                attr = getattr(model, attr_name)
+        # vars() de cada clase del MRO: sin dir() ni getattr(), que dispararía
+        # los descriptores InstrumentedAttribute de SQLAlchemy
+        seen = set()
+        for cls in model.__mro__:
+            for attr_name, attr in vars(cls).items():
+                if attr_name.startswith('_') or attr_name in seen:
+                    continue
+                seen.add(attr_name)
+                
+                if attr_name in self.ignored_properties:
+                    continue
                 
                 if isinstance(attr, property):
                     ret_type = self.inferencer.infer_from_property(attr)
                     
                     if ret_type is not None:
                         properties[attr_name] = ret_type
-                    
-            except Exception:
-                continue
         
+        self._cache[model] = properties
         return properties
\ No newline at end of file
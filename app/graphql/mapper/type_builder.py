@@ -8,7 +8,7 @@ class TypeBuilder:
     """Construye tipos Strawberry desde definiciones de campos"""
     
     # Palabras reservadas de Python que debemos evitar
-    PYTHON_KEYWORDS = set(keyword.kwlist) | {
+    PYTHON_KEYWORDS = frozenset(keyword.kwlist) | {
         'type', 'id', 'input', 'object', 'list', 'dict', 'set', 
         'str', 'int', 'float', 'bool', 'bytes'
     }
@@ -37,13 +37,20 @@ class TypeBuilder:
         return name
     
     @staticmethod
-    def build_type(type_name: str, fields: Dict[str, Type]) -> Type:
-        """Construye un tipo Strawberry"""
-        # ✅ Sanitizar nombres de campos
-        sanitized_fields = {
+    def sanitize_fields(fields: Dict[str, Type]) -> Dict[str, Type]:
+        """Sanitiza los nombres de campos; sin colisiones devuelve el mismo dict"""
+        if TypeBuilder.PYTHON_KEYWORDS.isdisjoint(fields):
+            return fields
+        return {
             TypeBuilder.sanitize_field_name(key): value 
             for key, value in fields.items()
         }
+    
+    @staticmethod
+    def build_type(type_name: str, fields: Dict[str, Type], sanitize: bool = True) -> Type:
+        """Construye un tipo Strawberry (sanitize=False si las claves ya vienen sanitizadas)"""
+        # ✅ Sanitizar nombres de campos
+        sanitized_fields = TypeBuilder.sanitize_fields(fields) if sanitize else fields
         
         # Crear clase dinámica con anotaciones
         dynamic_class = type(type_name, (), {"__annotations__": sanitized_fields})
@@ -54,13 +61,10 @@ class TypeBuilder:
         return strawberry_type
     
     @staticmethod
-    def build_input_type(type_name: str, fields: Dict[str, Type]) -> Type:
-        """Construye un InputType Strawberry"""
+    def build_input_type(type_name: str, fields: Dict[str, Type], sanitize: bool = True) -> Type:
+        """Construye un InputType Strawberry (sanitize=False si las claves ya vienen sanitizadas)"""
         # ✅ Sanitizar nombres de campos
-        sanitized_fields = {
-            TypeBuilder.sanitize_field_name(key): value 
-            for key, value in fields.items()
-        }
+        sanitized_fields = TypeBuilder.sanitize_fields(fields) if sanitize else fields
         
         # Crear clase dinámica
         dynamic_class = type(type_name, (), {"__annotations__": sanitized_fields})
@@ -1,11 +1,14 @@
 # app/graphql/mapper/type_inference.py
 """Type inference from Python to Strawberry"""
-from typing import Type, Optional, List, get_args, Any
+from typing import Type, Optional, List, Union, Any
+from types import UnionType
 from datetime import datetime, date
 from decimal import Decimal
 import enum
 
-from .utils import is_list_of_primitives
+from .utils import get_origin_args, get_return_annotation, is_list_of_primitives
+
+_BASIC_TYPES = (str, int, float, bool, datetime, date)
 
 class TypeInferencer:
     """Infiere tipos Strawberry desde propiedades Python"""
@@ -28,40 +31,32 @@ class TypeInferencer:
                 return int
             
             # Analizar anotación
-            if hasattr(func, '__annotations__') and 'return' in func.__annotations__:
-                ann = func.__annotations__['return']
-                ann_str = str(ann)
-                
-                # List[str], List[int] → Permitir
-                if is_list_of_primitives(ann_str):
-                    if 'List[str]' in ann_str or 'list[str]' in ann_str:
-                        return List[str]
-                    if 'List[int]' in ann_str or 'list[int]' in ann_str:
-                        return List[int]
+            ann = get_return_annotation(func)
+            if ann is not None and not isinstance(ann, str):
+                origin, args = get_origin_args(ann)
                 
-                # List[Model] → Ignorar
-                if '[' in ann_str and not is_list_of_primitives(ann_str):
-                    return None
+                # List[str], List[int] → Permitir; List[Model] → Ignorar
+                if origin is list:
+                    return List[args[0]] if is_list_of_primitives(ann) else None
                 
                 # Tipos básicos
-                if ann in (str, int, float, bool, datetime, date):
+                if ann in _BASIC_TYPES:
                     return ann
                 
-                # Optional[tipo_basico]
-                if 'Optional[' in ann_str:
-                    try:
-                        args = get_args(ann)
-                        if args and args[0] in (str, int, float, bool, datetime, date):
-                            return ann
-                    except:
-                        pass
+                # Optional[tipo_basico] / tipo_basico | None
+                if origin is Union or origin is UnionType:
+                    args = [arg for arg in args if arg is not type(None)]
+                    if len(args) == 1 and args[0] in _BASIC_TYPES:
+                        return ann
+                    return None
+                
+                # Otros genéricos (dict, tuple...) → Ignorar
+                if origin is not None:
+                    return None
                 
                 # Enum
-                try:
-                    if isinstance(ann, type) and issubclass(ann, enum.Enum):
-                        return ann
-                except:
-                    pass
+                if isinstance(ann, type) and issubclass(ann, enum.Enum):
+                    return ann
             
             # Propiedades _lista, _list → List[str]
             if name.endswith(('_lista', '_list', '_nombres', '_ids')):
@@ -1,35 +1,55 @@
 # app/graphql/mapper/utils.py
 """Utility functions for type mapping"""
-from typing import Type, get_origin, get_args, Optional
+from functools import lru_cache
+from types import UnionType
+from typing import Any, Tuple, Type, Union, get_origin, get_args, get_type_hints
 import enum
 from datetime import datetime, date
 from decimal import Decimal
 
+PRIMITIVE_TYPES = frozenset((str, int, float, bool, datetime, date, Decimal, type(None)))
+
+@lru_cache(maxsize=512)
+def _cached_origin_args(ann: Any) -> Tuple[Any, Tuple[Any, ...]]:
+    return get_origin(ann), get_args(ann)
+
+def get_origin_args(ann: Any) -> Tuple[Any, Tuple[Any, ...]]:
+    """(get_origin(ann), get_args(ann)), memoizado por anotación"""
+    try:
+        return _cached_origin_args(ann)
+    except TypeError:
+        # Anotaciones no hashables
+        return get_origin(ann), get_args(ann)
+
 def is_primitive_type(t: Type) -> bool:
     """Verifica si un tipo es primitivo/básico"""
-    primitives = (str, int, float, bool, datetime, date, Decimal, type(None))
-    
-    if t in primitives:
+    if t in PRIMITIVE_TYPES:
         return True
     
     if isinstance(t, type) and issubclass(t, enum.Enum):
         return True
     
-    origin = get_origin(t)
-    if origin is type(Optional):
-        args = get_args(t)
-        return args and args[0] in primitives
+    # Optional[X] / X | None
+    origin, args = get_origin_args(t)
+    if origin is Union or origin is UnionType:
+        args = [arg for arg in args if arg is not type(None)]
+        return len(args) == 1 and args[0] in PRIMITIVE_TYPES
     
     return False
 
-def is_list_of_primitives(ann_str: str) -> bool:
-    """¿Es List[str], List[int], etc?"""
-    if 'List[str]' in ann_str or 'list[str]' in ann_str:
-        return True
-    if 'List[int]' in ann_str or 'list[int]' in ann_str:
-        return True
-    if 'List[float]' in ann_str or 'list[float]' in ann_str:
-        return True
-    if 'List[bool]' in ann_str or 'list[bool]' in ann_str:
-        return True
-    return False
\ No newline at end of file
+@lru_cache(maxsize=None)
+def get_return_annotation(func: Any) -> Any:
+    """
+    Anotación de retorno como objeto de tipo (get_type_hints resuelve las
+    cadenas de `from __future__ import annotations`). None si no tiene.
+    """
+    try:
+        return get_type_hints(func).get('return')
+    except Exception:
+        # Referencias no resolubles: anotación tal cual
+        return getattr(func, '__annotations__', {}).get('return')
+
+def is_list_of_primitives(ann: Any) -> bool:
+    """¿Es List[str], list[int], etc? (anotación como objeto de tipo)"""
+    origin, args = get_origin_args(ann)
+    return origin is list and bool(args) and args[0] in PRIMITIVE_TYPES
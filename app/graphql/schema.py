@@ -1,73 +1,130 @@
 # app/graphql/schema.py - VERSIÓN COMPLETA CORREGIDA
 import strawberry
 import logging
+import operator
 from typing import List, Optional, Dict, Any, Type
-from pathlib import Path
+import dataclasses
 import importlib
+import pkgutil
+import sys
+import types
 import inspect
 from datetime import datetime, date
 from decimal import Decimal
 from sqlalchemy import String, select, or_
-from sqlalchemy.orm import RelationshipProperty
+from sqlalchemy import inspect as sa_inspect
+from sqlalchemy.orm import RelationshipProperty, joinedload, load_only, selectinload, undefer
+from strawberry.types.nodes import FragmentSpread, InlineFragment
+from strawberry.utils.str_converters import to_camel_case
+from geoalchemy2 import Geometry, Geography
+
+from app.core.config import settings
+from app.db.base import Base
+from app.graphql.coordinates import Coordinates, resolve_coordinates
 
 logger = logging.getLogger(__name__)
 
+# Tipo Python de la columna -> tipo GraphQL (fechas como str ISO; el resto, str)
+_COLUMN_GRAPHQL_TYPES = {
+    int: int,
+    str: str,
+    bool: bool,
+    float: float,
+    datetime: str,
+    date: str,
+    Decimal: float,
+}
+
+# Tipos cuyos valores pasan tal cual a GraphQL (sin isoformat/float)
+_PASSTHROUGH_TYPES = frozenset({int, str, bool, float})
+
+def _isoformat_or_none(value):
+    return value.isoformat() if value is not None else None
+
+def _float_or_none(value):
+    return float(value) if value is not None else None
+
+# python_type de la columna -> conversión de su valor (el resto: _to_graphql_value)
+_COLUMN_CONVERTERS = {
+    datetime: _isoformat_or_none,
+    date: _isoformat_or_none,
+    Decimal: _float_or_none,
+}
+
+def _column_python_type(column):
+    """python_type de la columna, o None para tipos especiales (geometry, json, etc.)"""
+    if isinstance(column.type, (Geometry, Geography)):
+        # Sin python_type: se evita la excepción NotImplementedError
+        return None
+    try:
+        return column.type.python_type
+    except NotImplementedError:
+        return None
+
 def get_graphql_type_for_column(column):
     """Determina el tipo GraphQL para una columna SQLAlchemy"""
-    field_name = column.name
+    python_type = _column_python_type(column)
     
-    try:
-        python_type = column.type.python_type
-        
-        if python_type == int:
-            if field_name == 'id':
-                return strawberry.ID
-            else:
-                return Optional[int] if column.nullable else int
-        elif python_type == str:
-            return Optional[str] if column.nullable else str
-        elif python_type == bool:
-            return Optional[bool] if column.nullable else bool
-        elif python_type == float:
-            return Optional[float] if column.nullable else float
-        elif python_type == datetime:
-            return Optional[str] if column.nullable else str
-        elif python_type == date:
-            return Optional[str] if column.nullable else str
-        elif python_type == Decimal:
-            return Optional[float] if column.nullable else float
-        else:
-            return Optional[str] if column.nullable else str
-            
-    except NotImplementedError:
-        # Manejar tipos especiales (geometry, json, etc.)
-        return Optional[str] if column.nullable else str
+    if python_type is int and column.name == 'id':
+        return strawberry.ID
+    
+    graphql_type = _COLUMN_GRAPHQL_TYPES.get(python_type, str)
+    return Optional[graphql_type] if column.nullable else graphql_type
+
+# Carpeta de modelos -> modelos cargados (los módulos no cambian en el proceso)
+_models_cache: Dict[str, List[Type]] = {}
+
+def _cached_import(module_name: str):
+    """Módulo ya importado desde sys.modules; import_module solo si falta"""
+    module = sys.modules.get(module_name)
+    if module is not None:
+        return module
+    return importlib.import_module(module_name)
 
 def load_all_models(folder: str = "app/db/models"):
     """Carga todos los modelos SQLAlchemy sin duplicados"""
-    models_dict = {}  # Usar dict para deduplicar por nombre
-    folder_path = Path(folder)
+    models = _models_cache.get(folder)
+    if models is None:
+        models = _models_cache[folder] = _load_all_models(folder)
+    # Copia: el llamador puede filtrar la lista
+    return list(models)
+
+def _load_all_models(folder: str) -> List[Type]:
+    prefix = folder.replace('/', '.') + '.'
+    module_order = {}  # módulo importado -> posición (orden de carga)
     
-    for py_file in folder_path.glob("*.py"):
-        if py_file.name.startswith("__"):
+    # Orden determinista (alfabético) e incluye subpaquetes
+    for _, module_name, is_package in pkgutil.walk_packages([folder], prefix):
+        if is_package:
             continue
         
-        module_name = f"{folder.replace('/', '.')}.{py_file.stem}"
-        
         try:
-            module = importlib.import_module(module_name)
-            for attr_name in dir(module):
-                attr = getattr(module, attr_name)
-                if hasattr(attr, "__tablename__") and not attr_name.startswith('_'):
-                    # Deduplicar: solo agregar si no existe
-                    if attr_name not in models_dict:
-                        logger.debug(f"📦 Modelo encontrado: {attr_name} (tabla: {attr.__tablename__})")
-                        models_dict[attr_name] = attr
-                    else:
-                        logger.debug(f"⚠️  Modelo duplicado omitido: {attr_name} en {module_name}")
+            _cached_import(module_name)
         except Exception as e:
             logger.warning(f"⚠️  Error cargando {module_name}: {e}")
+        
+        # Un fallo en el __init__ del paquete no implica que el módulo no
+        # se cargara: cuenta si quedó completo en sys.modules
+        if module_name in sys.modules:
+            module_order[module_name] = len(module_order)
+    
+    # El registry de la Base declarativa ya tiene cada clase mapeada una sola
+    # vez: no hace falta recorrer dir() de cada módulo
+    models_dict = {}  # Usar dict para deduplicar por nombre
+    mapped_classes = sorted(
+        (mapper.class_ for mapper in Base.registry.mappers
+         if mapper.class_.__module__ in module_order),
+        key=lambda cls: (module_order[cls.__module__], cls.__name__),
+    )
+    for model in mapped_classes:
+        model_name = model.__name__
+        if model_name.startswith('_'):
             continue
+        if model_name not in models_dict:
+            logger.debug("📦 Modelo encontrado: %s (tabla: %s)", model_name, model.__tablename__)
+            models_dict[model_name] = model
+        else:
+            logger.debug("⚠️  Modelo duplicado omitido: %s en %s", model_name, model.__module__)
     
     models = list(models_dict.values())
     logger.info(f"✅ {len(models)} modelos únicos cargados")
@@ -80,12 +137,57 @@ def get_excluded_field_names_for_model(model):
         return excluded
     
     for col in model.__table__.columns:
-        col_type_str = str(col.type).lower()
-        if 'geometry' in col_type_str or 'geography' in col_type_str:
+        if isinstance(col.type, (Geometry, Geography)):
             excluded.append(col.name)
     
     return excluded
 
+def make_coordinates_resolver(field_name: str):
+    """Resolver para una columna geometry expuesta como Coordinates"""
+    async def resolve(root, info: strawberry.Info) -> Optional[Coordinates]:
+        value = root._geometry_values.get(field_name)
+        if value is None:
+            return None
+        loader = info.context.get("coords_loader")
+        if loader is None:
+            return resolve_coordinates(value)
+        return await loader.load(value)
+    
+    return resolve
+
+# Modelo -> tipo Strawberry ya construido. Cada tipo solo depende de su
+# modelo, así que se reutiliza si create_schema() se ejecuta otra vez
+_type_cache: Dict[Type, Type] = {}
+
+# Modelo -> {nombre: input type} (Create/Update) ya construidos
+_input_cache: Dict[Type, Dict[str, Type]] = {}
+
+def _model_attributes(model):
+    """
+    (nombre, atributo) públicos de la clase y sus bases, como dir() + getattr()
+    pero leyendo el __dict__ de cada clase del MRO (gana la más derivada)
+    """
+    attributes = {}
+    for cls in model.__mro__:
+        for attr_name, attr in vars(cls).items():
+            if attr_name[0] != '_' and attr_name not in attributes:
+                attributes[attr_name] = attr
+    # Orden alfabético, igual que dir(): fija el orden de los campos en el schema
+    return sorted(attributes.items())
+
+def _make_column_getter(model, column_fields):
+    """
+    attrgetter que devuelve la tupla de valores de column_fields, o None si
+    algún campo no es atributo del modelo (se usa entonces el camino genérico)
+    """
+    if not column_fields or not all(hasattr(model, name) for name in column_fields):
+        return None
+    if len(column_fields) == 1:
+        # attrgetter con un solo nombre devuelve el valor, no una tupla
+        name = column_fields[0]
+        return lambda instance: (getattr(instance, name),)
+    return operator.attrgetter(*column_fields)
+
 def create_graphql_types(models):
     """Crea tipos GraphQL para todos los modelos sin duplicados"""
     type_registry = {}
@@ -99,6 +201,11 @@ def create_graphql_types(models):
             logger.warning(f"⚠️  Tipo {model_name} ya existe, omitiendo duplicado")
             continue
         
+        cached_type = _type_cache.get(model)
+        if cached_type is not None:
+            type_registry[model_name] = cached_type
+            continue
+        
         try:
             # Verificar estructura básica
             if not hasattr(model, '__table__'):
@@ -108,20 +215,38 @@ def create_graphql_types(models):
             
             # Campos de columnas
             fields = {}
+            deferred_columns = {}
+            geometry_fields = set(get_excluded_field_names_for_model(model))
+            coordinate_resolvers = {}
+            converted_columns = []  # (columna, conversión) de las que no pasan tal cual
             for column in model.__table__.columns:
                 field_name = column.name
+                
+                # Geometry/geography: campo Coordinates resuelto en lote (CoordinatesLoader)
+                if field_name in geometry_fields:
+                    coordinate_resolvers[field_name] = strawberry.field(
+                        resolver=make_coordinates_resolver(field_name)
+                    )
+                    continue
+                
                 graphql_type = get_graphql_type_for_column(column)
                 fields[field_name] = graphql_type
+                python_type = _column_python_type(column)
+                if python_type not in _PASSTHROUGH_TYPES:
+                    converted_columns.append(
+                        (field_name, _COLUMN_CONVERTERS.get(python_type, _to_graphql_value))
+                    )
+                
+                # Columnas deferred: se cargan solo si la query las pide
+                column_property = model.__mapper__.get_property_by_column(column)
+                if column_property.deferred:
+                    deferred_columns[to_camel_case(field_name)] = getattr(model, column_property.key)
             
             # Propiedades (@property)
             property_methods = {}
-            for attr_name in dir(model):
-                if attr_name.startswith('_'):
-                    continue
-                    
-                attr = getattr(model, attr_name)
+            for attr_name, attr in _model_attributes(model):
                 if isinstance(attr, property) and attr.fget:
-                    logger.debug(f"🔍 @property encontrado: {model_name}.{attr_name}")
+                    logger.debug("🔍 @property encontrado: %s.%s", model_name, attr_name)
                     
                     # Determinar tipo de retorno
                     return_type = Optional[str]
@@ -149,17 +274,37 @@ def create_graphql_types(models):
                     fields[attr_name] = return_type
                     property_methods[attr_name] = attr.fget
             
+            column_fields = tuple(name for name in fields if name not in property_methods)
+            
             # Crear tipo GraphQL
             type_class = strawberry.type(
                 type(model_name, (), {
                     "__annotations__": fields,
+                    **coordinate_resolvers,
                     "_property_methods": property_methods,
+                    # Campos que se copian directamente de la instancia (ni geometry ni @property)
+                    "_column_fields": column_fields,
+                    # Nombre GraphQL -> columna (incluidas geometry), para load_only()
+                    "_projection_columns": {
+                        to_camel_case(name): name for name in (*column_fields, *coordinate_resolvers)
+                    },
+                    "_property_graphql_names": {
+                        name: to_camel_case(name) for name in property_methods
+                    },
+                    # Lectura de todas las columnas en una sola llamada (ver convert_model_to_graphql)
+                    "_column_getter": _make_column_getter(model, column_fields),
+                    "_converted_columns": tuple(
+                        (name, convert) for name, convert in converted_columns if name in column_fields
+                    ),
+                    "_deferred_columns": deferred_columns,
+                    "_geometry_fields": tuple(coordinate_resolvers),
                     "_model_class": model,
                 })
             )
             
-            type_registry[model_name] = type_class
-            logger.info(f"✅ Tipo {model_name} creado con {len(fields)} campos")
+            type_registry[model_name] = _type_cache[model] = type_class
+            # Detalle por modelo solo en debug: el resumen final va en info
+            logger.debug("✅ Tipo %s creado con %d campos", model_name, len(fields))
             
         except Exception as e:
             logger.error(f"❌ Error creando tipo para {model_name}: {e}")
@@ -175,6 +320,11 @@ def create_graphql_types(models):
     
     return type_registry
 
+# Columnas que mantiene la base de datos y no se aceptan en Create/Update:
+# denominacion_principal_cached la escribe el trigger trg_sync_denominacion_principal
+# (alembic c4a8e1b2d3f5) al cambiar inmuebles_denominaciones
+_INPUT_EXCLUDED_COLUMNS = frozenset({'denominacion_principal_cached'})
+
 def create_input_types(models, type_registry):
     """Crea input types para creación y actualización"""
     input_registry = {}
@@ -184,10 +334,16 @@ def create_input_types(models, type_registry):
         if not model or not hasattr(model, '__table__'):
             continue
         
+        cached_inputs = _input_cache.get(model)
+        if cached_inputs is not None:
+            input_registry.update(cached_inputs)
+            continue
+        model_inputs = {}
+        
         # CREATE INPUT: solo columnas (no propiedades)
         create_fields = {}
         for column in model.__table__.columns:
-            if column.name == 'id':
+            if column.name == 'id' or column.name in _INPUT_EXCLUDED_COLUMNS:
                 continue
                 
             field_type = get_graphql_type_for_column(column)
@@ -203,11 +359,13 @@ def create_input_types(models, type_registry):
                     "__annotations__": create_fields
                 })
             )
-            input_registry[f"{model_name}CreateInput"] = CreateInput
+            model_inputs[f"{model_name}CreateInput"] = CreateInput
         
         # UPDATE INPUT: solo columnas (no propiedades), todas opcionales
         update_fields = {}
         for column in model.__table__.columns:
+            if column.name in _INPUT_EXCLUDED_COLUMNS:
+                continue
             if column.name == 'id':
                 update_fields['id'] = strawberry.ID
             else:
@@ -220,47 +378,370 @@ def create_input_types(models, type_registry):
                     "__annotations__": update_fields
                 })
             )
-            input_registry[f"{model_name}UpdateInput"] = UpdateInput
+            model_inputs[f"{model_name}UpdateInput"] = UpdateInput
+        
+        _input_cache[model] = model_inputs
+        input_registry.update(model_inputs)
     
     logger.info(f"✅ {len(input_registry)} input types creados")
     return input_registry
 
-def convert_model_to_graphql(instance, strawberry_type):
-    """Convierte instancia SQLAlchemy a instancia GraphQL"""
+def _requested_field_names(info: strawberry.Info) -> set:
+    """Nombres (camelCase) de los campos pedidos sobre el tipo del resolver"""
+    names = set()
+    pending = [selection for field in info.selected_fields for selection in field.selections]
+    while pending:
+        selection = pending.pop()
+        if isinstance(selection, (InlineFragment, FragmentSpread)):
+            # Los campos de los fragmentos también cuentan como pedidos
+            pending.extend(selection.selections)
+        else:
+            names.add(selection.name)
+    return names
+
+def project_requested_columns(stmt, strawberry_type, info: strawberry.Info):
+    """
+    load_only() de las columnas pedidas: en tablas anchas evita traer columnas
+    que la query no usa. Devuelve (stmt, requested) para convert_model_to_graphql.
+    Si se pide alguna @property no se proyecta: puede leer cualquier columna
+    """
+    requested = _requested_field_names(info)
+    projection_columns = getattr(strawberry_type, '_projection_columns', None)
+    if not projection_columns:
+        return stmt, requested
+    if any(name in requested for name in strawberry_type._property_graphql_names.values()):
+        return stmt, requested
+    
+    model = strawberry_type._model_class
+    columns = [
+        getattr(model, projection_columns[name]) for name in requested if name in projection_columns
+    ]
+    return (stmt.options(load_only(*columns)) if columns else stmt), requested
+
+def undefer_requested_columns(stmt, strawberry_type, info: strawberry.Info):
+    """Añade undefer() para las columnas deferred que la query GraphQL selecciona"""
+    deferred_columns = getattr(strawberry_type, '_deferred_columns', None)
+    if not deferred_columns:
+        return stmt
+    
+    requested = _requested_field_names(info)
+    options = [undefer(attr) for name, attr in deferred_columns.items() if name in requested]
+    return stmt.options(*options) if options else stmt
+
+# Tipo Strawberry -> {campo @property (camelCase): ((relación, uselist), ...) que lee}
+_property_relationships: Dict[Type, Dict[str, tuple]] = {}
+
+def _relationships_read_by(fget, relationship_keys, property_methods) -> set:
+    """
+    Relaciones que lee una @property: nombres de atributo de su bytecode
+    (co_names, incluidas funciones anidadas como generadores) que son
+    relaciones, siguiendo las otras @property del modelo que use
+    """
+    found = set()
+    seen = {fget}
+    pending = [fget.__code__]
+    while pending:
+        code = pending.pop()
+        for name in code.co_names:
+            if name in relationship_keys:
+                found.add(name)
+            elif name in property_methods and property_methods[name] not in seen:
+                seen.add(property_methods[name])
+                pending.append(property_methods[name].__code__)
+        pending.extend(const for const in code.co_consts if isinstance(const, types.CodeType))
+    return found
+
+def _get_property_relationships(strawberry_type) -> Dict[str, tuple]:
+    """Relaciones por campo @property, calculado en la primera petición (mappers ya configurados)"""
+    property_relationships = _property_relationships.get(strawberry_type)
+    if property_relationships is not None:
+        return property_relationships
+    
+    relationships = {rel.key: rel for rel in sa_inspect(strawberry_type._model_class).relationships}
+    property_methods = strawberry_type._property_methods
+    property_relationships = {}
+    for name, fget in property_methods.items():
+        if not hasattr(fget, '__code__'):
+            continue
+        keys = _relationships_read_by(fget, relationships, property_methods)
+        if keys:
+            property_relationships[to_camel_case(name)] = tuple(
+                (key, relationships[key].uselist) for key in sorted(keys)
+            )
+    
+    _property_relationships[strawberry_type] = property_relationships
+    return property_relationships
+
+def load_property_relationships(stmt, strawberry_type, info: strawberry.Info):
+    """
+    Carga eager de las relaciones que leen las @property pedidas: una consulta
+    por relación en lugar de un lazy load por fila (N+1, que además falla con
+    AsyncSession). joinedload para many-to-one y selectinload para colecciones.
+    """
+    if not getattr(strawberry_type, '_property_methods', None):
+        return stmt
+    property_relationships = _get_property_relationships(strawberry_type)
+    if not property_relationships:
+        return stmt
+    
+    requested = _requested_field_names(info)
+    to_load = {
+        key: uselist
+        for name, relationships in property_relationships.items() if name in requested
+        for key, uselist in relationships
+    }
+    model = strawberry_type._model_class
+    options = [
+        selectinload(getattr(model, key)) if uselist else joinedload(getattr(model, key))
+        for key, uselist in to_load.items()
+    ]
+    return stmt.options(*options) if options else stmt
+
+def _to_graphql_value(value):
+    """Convierte tipos especiales (fechas a ISO, Decimal a float)"""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return float(value)
+    return value
+
+def convert_model_to_graphql(instance, strawberry_type, requested: Optional[set] = None):
+    """
+    Convierte instancia SQLAlchemy a instancia GraphQL.
+    
+    requested: campos pedidos (ver project_requested_columns); las @property
+    no pedidas no se evalúan, podrían leer columnas no cargadas
+    """
     if not instance:
         return None
     
     kwargs = {}
     
-    # Campos de columna
-    for field_name in strawberry_type.__annotations__.keys():
-        if hasattr(instance, field_name):
-            value = getattr(instance, field_name)
-            
-            # Convertir tipos especiales
-            if isinstance(value, (datetime, date)):
-                value = value.isoformat()
-            elif isinstance(value, Decimal):
-                value = float(value)
-            
-            kwargs[field_name] = value
+    # Columnas deferred (o fuera de load_only) no cargadas: no se pueden cargar en lazy con AsyncSession
+    state = None
+    if requested is not None or getattr(strawberry_type, '_deferred_columns', None):
+        state = sa_inspect(instance)
+        unloaded = state.unloaded
+    else:
+        unloaded = ()
+    geometry_fields = getattr(strawberry_type, '_geometry_fields', ())
+    
+    # Campos de columna (clasificados al crear el tipo)
+    column_fields = getattr(strawberry_type, '_column_fields', None)
+    if column_fields is None:
+        column_fields = [
+            name for name in strawberry_type.__annotations__
+            if name not in geometry_fields
+        ]
+    
+    # Solo cuentan las columnas: 'unloaded' incluye también todas las
+    # relaciones no cargadas, que aquí no se leen
+    unloaded_columns = unloaded.intersection(column_fields) if unloaded else ()
+    
+    column_getter = getattr(strawberry_type, '_column_getter', None)
+    if column_getter is not None and not unloaded_columns:
+        # Camino rápido: todas las columnas en una llamada; solo se convierten
+        # las de tipos no primitivos (fechas, Decimal...)
+        kwargs = dict(zip(column_fields, column_getter(instance)))
+        for field_name, convert in strawberry_type._converted_columns:
+            kwargs[field_name] = convert(kwargs[field_name])
+    elif column_getter is not None:
+        # Carga parcial (load_only/deferred): los valores cargados están en el
+        # dict del estado; las columnas no cargadas quedan a None sin tocarlas
+        values = state.dict
+        kwargs = {field_name: values.get(field_name) for field_name in column_fields}
+        for field_name, convert in strawberry_type._converted_columns:
+            kwargs[field_name] = convert(kwargs[field_name])
+    else:
+        for field_name in column_fields:
+            if field_name in unloaded_columns:
+                kwargs[field_name] = None
+            elif hasattr(instance, field_name):
+                kwargs[field_name] = _to_graphql_value(getattr(instance, field_name))
     
     # Campos @property
     property_methods = getattr(strawberry_type, '_property_methods', {})
+    property_graphql_names = getattr(strawberry_type, '_property_graphql_names', {})
     for prop_name, fget in property_methods.items():
-        if prop_name in strawberry_type.__annotations__:
-            try:
-                value = fget(instance)
-                if isinstance(value, (datetime, date)):
-                    value = value.isoformat()
-                elif isinstance(value, Decimal):
-                    value = float(value)
-                kwargs[prop_name] = value
-            except Exception as e:
-                logger.debug(f"⚠️  Error en propiedad {prop_name}: {e}")
-                kwargs[prop_name] = None
-    
-    return strawberry_type(**kwargs)
+        if requested is not None and property_graphql_names.get(prop_name) not in requested:
+            kwargs[prop_name] = None
+            continue
+        try:
+            kwargs[prop_name] = _to_graphql_value(fget(instance))
+        except Exception as e:
+            logger.debug("⚠️  Error en propiedad %s: %s", prop_name, e)
+            kwargs[prop_name] = None
+    
+    obj = strawberry_type(**kwargs)
+    
+    # Valores geometry crudos para los resolvers de Coordinates
+    obj._geometry_values = {
+        field_name: getattr(instance, field_name, None)
+        for field_name in geometry_fields
+        if field_name not in unloaded
+    }
+    return obj
+
+def make_get_one_resolver(model, strawberry_type, model_name: str):
+    """Query singular (get by id) para un modelo"""
+    async def get_one_resolver(
+        info: strawberry.Info, 
+        id: strawberry.ID
+    ) -> Optional[strawberry_type]:
+        try:
+            db = info.context["request"].state.db
+            stmt = select(model).where(model.id == id)
+            stmt = undefer_requested_columns(stmt, strawberry_type, info)
+            stmt = load_property_relationships(stmt, strawberry_type, info)
+            result = await db.execute(stmt)
+            instance = result.scalar_one_or_none()
+            # Solo las @property pedidas: las demás podrían leer relaciones no cargadas
+            requested = _requested_field_names(info)
+            return convert_model_to_graphql(instance, strawberry_type, requested)
+        except Exception as e:
+            logger.error(f"Error en get{model_name}: {e}")
+            return None
+    
+    return get_one_resolver
+
+def _clamp_limit(limit: int) -> int:
+    """Acota el 'limit' pedido por el cliente a [1, GRAPHQL_MAX_LIMIT]"""
+    return max(1, min(limit, settings.GRAPHQL_MAX_LIMIT))
+
+_LIST_QUERY_DESCRIPTION = (
+    "Página de como mucho `limit` elementos ordenados por id. Para la siguiente "
+    "página, pasar en `after` el id del último elemento recibido; una página "
+    "con menos de `limit` elementos es la última."
+)
+
+def make_get_all_resolver(model, strawberry_type, model_name: str):
+    """
+    Query plural (list all) para un modelo, paginada por keyset:
+    
+    - El orden es por id (UUID): estable entre páginas, pero no cronológico
+    - 'after' debe ser el id del último elemento de la página anterior
+    - No hay indicador de "hay más": una página con menos de 'limit'
+      elementos es la última
+    """
+    async def get_all_resolver(
+        info: strawberry.Info,
+        after: Optional[strawberry.ID] = None,
+        limit: int = 50
+    ) -> List[strawberry_type]:
+        try:
+            db = info.context["request"].state.db
+            # Keyset sobre el índice de la PK, sin OFFSET
+            stmt = select(model).order_by(model.id).limit(_clamp_limit(limit))
+            if after is not None:
+                stmt = stmt.where(model.id > after)
+            stmt, requested = project_requested_columns(stmt, strawberry_type, info)
+            stmt = undefer_requested_columns(stmt, strawberry_type, info)
+            stmt = load_property_relationships(stmt, strawberry_type, info)
+            result = await db.execute(stmt)
+            instances = result.scalars().all()
+            return [convert_model_to_graphql(inst, strawberry_type, requested) for inst in instances]
+        except Exception as e:
+            logger.error(f"Error en list{model_name}s: {e}")
+            return []
+    
+    return get_all_resolver
+
+def make_search_resolver(model, strawberry_type, model_name: str):
+    """Search query (ilike sobre las columnas de texto) para un modelo"""
+    # Columnas de texto (calculado una vez por modelo, no por petición)
+    string_columns = tuple(
+        column for column in model.__table__.columns if isinstance(column.type, String)
+    ) if hasattr(model, '__table__') else ()
+    
+    async def search_resolver(
+        info: strawberry.Info,
+        search: Optional[str] = None,
+        limit: int = 50
+    ) -> List[strawberry_type]:
+        try:
+            db = info.context["request"].state.db
+            stmt = select(model)
+            
+            if search and string_columns:
+                pattern = f"%{search}%"
+                stmt = stmt.where(or_(*(column.ilike(pattern) for column in string_columns)))
+            
+            stmt = stmt.limit(_clamp_limit(limit))
+            stmt, requested = project_requested_columns(stmt, strawberry_type, info)
+            stmt = undefer_requested_columns(stmt, strawberry_type, info)
+            stmt = load_property_relationships(stmt, strawberry_type, info)
+            result = await db.execute(stmt)
+            instances = result.scalars().all()
+            return [convert_model_to_graphql(inst, strawberry_type, requested) for inst in instances]
+        except Exception as e:
+            logger.error(f"Error en search{model_name}s: {e}")
+            return []
+    
+    return search_resolver
+
+def make_create_resolver(model, strawberry_type, model_name: str, create_input):
+    """Mutation create para un modelo"""
+    # Columnas asignables (calculado una vez por modelo, no por petición)
+    column_names = frozenset(
+        column.name for column in model.__table__.columns if column.name != 'id'
+    ) if hasattr(model, '__table__') else frozenset()
+    # Campos del input que son columnas: se leen con getattr (sin depender de __dict__)
+    input_fields = tuple(
+        field.name for field in dataclasses.fields(create_input) if field.name in column_names
+    )
+    
+    async def create_resolver(
+        info: strawberry.Info,
+        data: create_input
+    ) -> Optional[strawberry_type]:
+        try:
+            db = info.context["request"].state.db
+            
+            # Extraer datos (solo columnas con valor; sin UNSET ni None)
+            data_dict = {
+                key: value for key in input_fields
+                if (value := getattr(data, key)) is not None and value is not strawberry.UNSET
+            }
+            
+            # Crear instancia
+            instance = model(**data_dict)
+            db.add(instance)
+            await db.commit()
+            await db.refresh(instance)
+            
+            return convert_model_to_graphql(instance, strawberry_type, _requested_field_names(info))
+        except Exception as e:
+            logger.error(f"Error en create{model_name}: {e}")
+            await db.rollback()
+            return None
+    
+    return create_resolver
+
+def make_delete_resolver(model, model_name: str):
+    """Mutation delete para un modelo"""
+    async def delete_resolver(
+        info: strawberry.Info,
+        id: strawberry.ID
+    ) -> bool:
+        try:
+            db = info.context["request"].state.db
+            
+            stmt = select(model).where(model.id == id)
+            result = await db.execute(stmt)
+            instance = result.scalar_one_or_none()
+            
+            if not instance:
+                return False
+            
+            await db.delete(instance)
+            await db.commit()
+            return True
+        except Exception as e:
+            logger.error(f"Error en delete{model_name}: {e}")
+            await db.rollback()
+            return False
+    
+    return delete_resolver
 
 def create_queries(models, type_registry):
     """Crea queries automáticas"""
@@ -271,71 +752,18 @@ def create_queries(models, type_registry):
         if not model:
             continue
         
-        # Query singular (get by id)
-        async def get_one_resolver(
-            info: strawberry.Info, 
-            id: strawberry.ID
-        ) -> Optional[strawberry_type]:
-            try:
-                db = info.context["request"].state.db
-                stmt = select(model).where(model.id == id)
-                result = await db.execute(stmt)
-                instance = result.scalar_one_or_none()
-                return convert_model_to_graphql(instance, strawberry_type)
-            except Exception as e:
-                logger.error(f"Error en get{model_name}: {e}")
-                return None
-        
-        # Query plural (list all)
-        async def get_all_resolver(
-            info: strawberry.Info
-        ) -> List[strawberry_type]:
-            try:
-                db = info.context["request"].state.db
-                stmt = select(model).limit(50)
-                result = await db.execute(stmt)
-                instances = result.scalars().all()
-                return [convert_model_to_graphql(inst, strawberry_type) for inst in instances]
-            except Exception as e:
-                logger.error(f"Error en list{model_name}s: {e}")
-                return []
-        
-        # Search query
-        async def search_resolver(
-            info: strawberry.Info,
-            search: Optional[str] = None,
-            limit: int = 50
-        ) -> List[strawberry_type]:
-            try:
-                db = info.context["request"].state.db
-                stmt = select(model)
-                
-                if search and hasattr(model, '__table__'):
-                    search_filters = []
-                    for column in model.__table__.columns:
-                        if isinstance(column.type, String):
-                            search_filters.append(column.ilike(f"%{search}%"))
-                    
-                    if search_filters:
-                        stmt = stmt.where(or_(*search_filters))
-                
-                stmt = stmt.limit(limit)
-                result = await db.execute(stmt)
-                instances = result.scalars().all()
-                return [convert_model_to_graphql(inst, strawberry_type) for inst in instances]
-            except Exception as e:
-                logger.error(f"Error en search{model_name}s: {e}")
-                return []
-        
-        # Añadir anotaciones de retorno
-        get_one_resolver.__annotations__['return'] = Optional[strawberry_type]
-        get_all_resolver.__annotations__['return'] = List[strawberry_type]
-        search_resolver.__annotations__['return'] = List[strawberry_type]
-        
-        # Registrar queries
-        queries[f"get{model_name}"] = strawberry.field(get_one_resolver)
-        queries[f"list{model_name}s"] = strawberry.field(get_all_resolver)
-        queries[f"search{model_name}s"] = strawberry.field(search_resolver)
+        # Los resolvers se crean en factorías: cada uno captura su propio
+        # modelo/tipo (un closure en el bucle usaría siempre el último)
+        queries[f"get{model_name}"] = strawberry.field(
+            make_get_one_resolver(model, strawberry_type, model_name)
+        )
+        queries[f"list{model_name}s"] = strawberry.field(
+            make_get_all_resolver(model, strawberry_type, model_name),
+            description=_LIST_QUERY_DESCRIPTION,
+        )
+        queries[f"search{model_name}s"] = strawberry.field(
+            make_search_resolver(model, strawberry_type, model_name)
+        )
     
     logger.info(f"✅ {len(queries)} queries creadas")
     return queries
@@ -351,65 +779,15 @@ def create_mutations(models, type_registry, input_registry):
         
         # CREATE mutation
         if f"{model_name}CreateInput" in input_registry:
-            CreateInput = input_registry[f"{model_name}CreateInput"]
-            
-            async def create_resolver(
-                info: strawberry.Info,
-                data: CreateInput
-            ) -> Optional[strawberry_type]:
-                try:
-                    db = info.context["request"].state.db
-                    
-                    # Extraer datos (solo columnas)
-                    data_dict = {}
-                    if hasattr(model, '__table__'):
-                        for column in model.__table__.columns:
-                            col_name = column.name
-                            if col_name != 'id' and hasattr(data, col_name):
-                                value = getattr(data, col_name)
-                                if value is not None:
-                                    data_dict[col_name] = value
-                    
-                    # Crear instancia
-                    instance = model(**data_dict)
-                    db.add(instance)
-                    await db.commit()
-                    await db.refresh(instance)
-                    
-                    return convert_model_to_graphql(instance, strawberry_type)
-                except Exception as e:
-                    logger.error(f"Error en create{model_name}: {e}")
-                    await db.rollback()
-                    return None
-            
-            create_resolver.__annotations__['return'] = Optional[strawberry_type]
-            mutations[f"create{model_name}"] = strawberry.mutation(create_resolver)
+            create_input = input_registry[f"{model_name}CreateInput"]
+            mutations[f"create{model_name}"] = strawberry.mutation(
+                make_create_resolver(model, strawberry_type, model_name, create_input)
+            )
         
         # DELETE mutation
-        async def delete_resolver(
-            info: strawberry.Info,
-            id: strawberry.ID
-        ) -> bool:
-            try:
-                db = info.context["request"].state.db
-                
-                stmt = select(model).where(model.id == id)
-                result = await db.execute(stmt)
-                instance = result.scalar_one_or_none()
-                
-                if not instance:
-                    return False
-                
-                await db.delete(instance)
-                await db.commit()
-                return True
-            except Exception as e:
-                logger.error(f"Error en delete{model_name}: {e}")
-                await db.rollback()
-                return False
-        
-        delete_resolver.__annotations__['return'] = bool
-        mutations[f"delete{model_name}"] = strawberry.mutation(delete_resolver)
+        mutations[f"delete{model_name}"] = strawberry.mutation(
+            make_delete_resolver(model, model_name)
+        )
     
     logger.info(f"✅ {len(mutations)} mutations creadas")
     return mutations
@@ -421,6 +799,11 @@ def create_schema(models_folder: str = "app/db/models") -> strawberry.Schema:
     try:
         # 1. Cargar modelos
         models = load_all_models(models_folder)
+        if settings.GRAPHQL_MODELS:
+            # Solo se construyen tipos/resolvers de los modelos configurados
+            enabled = set(settings.GRAPHQL_MODELS)
+            models = [model for model in models if model.__name__ in enabled]
+            logger.info(f"✅ GRAPHQL_MODELS: {len(models)} modelos habilitados")
         if not models:
             logger.error("❌ No se encontraron modelos")
             raise ValueError("No se encontraron modelos")
@@ -1,7 +1,10 @@
 """app/graphql/spanish.py - Configuración de pluralización al español"""
+from functools import lru_cache
+from types import MappingProxyType
 
-# Palabras con plural invariante (no cambian)
-PLURALES_INVARIABLES = {
+# Palabras con plural invariante (no cambian). Inmutables: pluralize()
+# memoiza sus resultados, un cambio en tiempo de ejecución no se vería
+PLURALES_INVARIABLES = frozenset({
     'crisis',
     'tesis',
     'sintesis',
@@ -10,21 +13,28 @@ PLURALES_INVARIABLES = {
     'parentesis',
     'hipotesis',
     'enfasis',
-}
+})
+
+# Sufijos invariables como tupla: str.endswith comprueba todos en una sola llamada
+_SUFIJOS_INVARIABLES = tuple(PLURALES_INVARIABLES)
 
 # Excepciones específicas (solo si las reglas lingüísticas fallan)
 # Formato: 'singular': 'plural'
-PLURALES_EXCEPCIONES = {
+PLURALES_EXCEPCIONES = MappingProxyType({
     # Añadir aquí solo casos especiales que las reglas no cubran
     # Ejemplo:
     # 'caracter': 'caracteres',
-}
+})
 
 
+@lru_cache(maxsize=512)
 def pluralize(word: str) -> str:
     """
     Pluraliza una palabra en español según reglas lingüísticas.
     
+    Función pura: el resultado se memoiza por palabra (los nombres de
+    modelo se repiten en cada construcción del schema).
+    
     Reglas implementadas:
     - Invariables: crisis, tesis, análisis, diócesis, etc.
     - Terminadas en -ción/-sión: añade 'es'
@@ -63,7 +73,7 @@ def pluralize(word: str) -> str:
         return word_lower
     
     # Algunos invariables tienen sufijos específicos
-    if any(word_lower.endswith(inv) for inv in PLURALES_INVARIABLES):
+    if word_lower.endswith(_SUFIJOS_INVARIABLES):
         return word_lower
     
     # 3. Terminadas en -ción o -sión
@@ -1,8 +1,11 @@
 import strawberry
+from dataclasses import dataclass
 from typing import List, Optional, Generic, TypeVar
 from enum import Enum
 
-# PageInfo SIN decorador (se registra en schema.py)
+# PageInfo SIN decorador strawberry (se registra en schema.py); dataclass
+# para poder construirlo con argumentos con nombre
+@dataclass
 class PageInfo:
     total: int
     page: int
@@ -15,6 +18,9 @@ class PageInfo:
 T = TypeVar('T')
 
 class PaginatedResult(Generic[T]):
+    # Sin __dict__ por instancia: se crea uno por listado
+    __slots__ = ('items', 'page_info')
+    
     def __init__(self, items: List[T], page_info: PageInfo):
         self.items = items
         self.page_info = page_info
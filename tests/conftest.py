@@ -0,0 +1,115 @@
+"""Fixtures compartidas: modelos del dominio, modelo aislado y sesión SQLite en memoria"""
+import uuid
+from datetime import datetime
+from types import SimpleNamespace
+from typing import Optional
+
+import pytest
+from sqlalchemy import DateTime, ForeignKey, String, create_engine, func
+from sqlalchemy.orm import DeclarativeBase, Mapped, Session, mapped_column, relationship
+from sqlalchemy.pool import StaticPool
+from strawberry.types.nodes import SelectedField
+
+from app.graphql.schema import load_all_models
+
+
+# Modelo aislado de app.db.models: se puede consultar en SQLite sin PostGIS
+class _Base(DeclarativeBase):
+    pass
+
+
+class Categoria(_Base):
+    __tablename__ = "categorias"
+
+    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    nombre: Mapped[str] = mapped_column(String(100))
+
+
+class Elemento(_Base):
+    """PK UUID, columna única, timestamp de servidor, soft delete y una relación"""
+    __tablename__ = "elementos"
+
+    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    nombre: Mapped[str] = mapped_column(String(100))
+    codigo: Mapped[Optional[str]] = mapped_column(String(20), unique=True)
+    categoria_id: Mapped[Optional[str]] = mapped_column(ForeignKey("categorias.id"))
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
+    deleted_at: Mapped[Optional[datetime]] = mapped_column(DateTime)
+
+    categoria: Mapped[Optional[Categoria]] = relationship()
+
+    @property
+    def nombre_categoria(self) -> str:
+        return self.categoria.nombre if self.categoria else None
+
+
+class _AsyncSessionAdapter:
+    """Interfaz await de AsyncSession sobre una Session síncrona"""
+
+    def __init__(self, session: Session):
+        self.sync_session = session
+
+    async def execute(self, stmt, params=None):
+        return self.sync_session.execute(stmt, params)
+
+    async def scalar(self, stmt, params=None):
+        return self.sync_session.scalar(stmt, params)
+
+    async def commit(self):
+        self.sync_session.commit()
+
+    async def refresh(self, instance, attribute_names=None):
+        self.sync_session.refresh(instance, attribute_names)
+
+    async def delete(self, instance):
+        self.sync_session.delete(instance)
+
+    def add(self, instance):
+        self.sync_session.add(instance)
+
+
+@pytest.fixture(scope="session")
+def domain_models():
+    """Modelos de app.db.models por nombre de clase"""
+    return {model.__name__: model for model in load_all_models()}
+
+
+@pytest.fixture
+def inmueble_model(domain_models):
+    assert "Inmueble" in domain_models, "modelo Inmueble no cargado"
+    return domain_models["Inmueble"]
+
+
+@pytest.fixture
+def elemento_model():
+    return Elemento
+
+
+@pytest.fixture
+def db_session():
+    """Sesión sobre SQLite en memoria con las tablas del modelo aislado"""
+    engine = create_engine("sqlite://", poolclass=StaticPool)
+    _Base.metadata.create_all(engine)
+    with Session(engine, expire_on_commit=False) as session:
+        yield _AsyncSessionAdapter(session)
+    engine.dispose()
+
+
+@pytest.fixture
+def make_info(db_session):
+    """
+    Info mínimo de un resolver raíz: la sesión en request.state.db y los
+    campos pedidos (nombres GraphQL) como selección del campo raíz
+    """
+    def _make_info(*field_names):
+        selections = [
+            SelectedField(name=name, directives={}, arguments={}, selections=[])
+            for name in field_names
+        ]
+        return SimpleNamespace(
+            context={"request": SimpleNamespace(state=SimpleNamespace(db=db_session))},
+            selected_fields=[
+                SelectedField(name="query", directives={}, arguments={}, selections=selections)
+            ],
+        )
+    return _make_info
@@ -0,0 +1,111 @@
+"""CRUDResolver sobre SQLite en memoria (ver conftest)"""
+import asyncio
+
+import pytest
+from sqlalchemy import select
+
+from app.graphql.crud import CRUDResolver
+from app.graphql.types import FilterInput, FilterOperator, PaginationInput, SortInput
+
+
+@pytest.fixture
+def crud(elemento_model):
+    return CRUDResolver(elemento_model, mapper=None)
+
+
+def _insert(db_session, model, **values):
+    instance = model(**values)
+    db_session.add(instance)
+    asyncio.run(db_session.commit())
+    return instance
+
+
+@pytest.fixture
+def cinco_elementos(db_session, elemento_model):
+    return [
+        _insert(db_session, elemento_model, nombre=f"Elemento {numero}", codigo=f"E-{numero}")
+        for numero in range(5)
+    ]
+
+
+def test_list_pagina_y_total(crud, db_session, cinco_elementos):
+    result = asyncio.run(crud.list(
+        db_session,
+        sort=[SortInput(field="nombre", direction="desc")],
+        pagination=PaginationInput(page=2, page_size=2),
+    ))
+
+    assert [instance.nombre for instance in result.items] == ["Elemento 2", "Elemento 1"]
+    page_info = result.page_info
+    assert (page_info.total, page_info.total_pages) == (5, 3)
+    assert page_info.has_next and page_info.has_previous
+
+
+def test_list_pagina_fuera_de_rango_mantiene_el_total(crud, db_session, cinco_elementos):
+    result = asyncio.run(crud.list(db_session, pagination=PaginationInput(page=9, page_size=2)))
+
+    assert result.items == []
+    assert result.page_info.total == 5
+    assert not result.page_info.has_next
+
+
+def test_list_filtro_por_columna_unica(crud, db_session, cinco_elementos):
+    filters = [FilterInput(field="codigo", operator=FilterOperator.EQ, value="E-3")]
+
+    result = asyncio.run(crud.list(db_session, filters=filters))
+
+    assert [instance.nombre for instance in result.items] == ["Elemento 3"]
+    assert result.page_info.total == 1
+    assert not result.page_info.has_previous
+
+
+def test_update_many_descarta_claves_no_asignables(crud, db_session, elemento_model):
+    ermita = _insert(db_session, elemento_model, nombre="Ermita")
+    torre = _insert(db_session, elemento_model, nombre="Torre")
+    rows = [
+        # 'categoria' es una relación y 'no_existe' no es columna
+        {"id": ermita.id, "nombre": "Ermita de San Roque", "categoria": "Iglesias", "no_existe": 1},
+        # Solo claves no asignables: no queda nada que actualizar
+        {"id": torre.id, "no_existe": 1},
+    ]
+
+    updated = asyncio.run(crud.update_many(db_session, rows))
+
+    assert [instance.id for instance in updated] == [ermita.id]
+    nombres = asyncio.run(db_session.execute(select(elemento_model.nombre).order_by(elemento_model.nombre)))
+    assert nombres.scalars().all() == ["Ermita de San Roque", "Torre"]
+
+
+def test_update_many_sin_filas_validas_no_ejecuta_nada(crud, db_session):
+    rows = [{"nombre": "Sin id"}, {"id": "c", "otra": 2}]
+
+    assert asyncio.run(crud.update_many(db_session, rows)) == []
+
+
+def test_create_many_ignora_pk_y_columnas_no_asignables(crud, db_session):
+    rows = [
+        {"id": "impuesto", "nombre": "Ermita", "deleted_at": "2020-01-01", "no_existe": 1},
+        {"nombre": "Torre", "codigo": "T-1"},
+    ]
+
+    created = asyncio.run(crud.create_many(db_session, rows))
+
+    assert sorted(instance.nombre for instance in created) == ["Ermita", "Torre"]
+    assert all(instance.id != "impuesto" for instance in created)
+    assert all(instance.deleted_at is None for instance in created)
+    assert all(instance.created_at is not None for instance in created)
+
+
+def test_delete_many_no_vuelve_a_marcar_las_ya_borradas(crud, db_session, elemento_model):
+    ermita = _insert(db_session, elemento_model, nombre="Ermita")
+    torre = _insert(db_session, elemento_model, nombre="Torre")
+
+    assert asyncio.run(crud.delete_many(db_session, [ermita.id])) == 1
+    borrada_en = asyncio.run(
+        db_session.scalar(select(elemento_model.deleted_at).where(elemento_model.id == ermita.id))
+    )
+
+    assert asyncio.run(crud.delete_many(db_session, [ermita.id, torre.id])) == 1
+    assert asyncio.run(
+        db_session.scalar(select(elemento_model.deleted_at).where(elemento_model.id == ermita.id))
+    ) == borrada_en
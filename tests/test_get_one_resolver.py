@@ -0,0 +1,41 @@
+"""Query singular generada por make_get_one_resolver"""
+import asyncio
+
+import pytest
+
+from app.graphql.schema import create_graphql_types, make_get_one_resolver
+
+
+@pytest.fixture
+def get_elemento(elemento_model, db_session, make_info, monkeypatch):
+    elemento = elemento_model(nombre="Ermita")
+    db_session.add(elemento)
+    asyncio.run(db_session.commit())
+
+    strawberry_type = create_graphql_types([elemento_model])["Elemento"]
+    # Registra qué @property se evalúan
+    evaluated = []
+    property_methods = {
+        name: (lambda instance, name=name, fget=fget: evaluated.append(name) or fget(instance))
+        for name, fget in strawberry_type._property_methods.items()
+    }
+    monkeypatch.setattr(strawberry_type, "_property_methods", property_methods)
+    resolver = make_get_one_resolver(elemento_model, strawberry_type, "Elemento")
+
+    def _get(*fields):
+        return asyncio.run(resolver(make_info(*fields), id=elemento.id)), evaluated
+    return _get
+
+
+def test_get_one_no_evalua_propiedades_no_pedidas(get_elemento):
+    elemento, evaluated = get_elemento("id", "nombre")
+
+    assert elemento.nombre == "Ermita"
+    assert evaluated == []
+    assert elemento.nombre_categoria is None
+
+
+def test_get_one_evalua_propiedades_pedidas(get_elemento):
+    elemento, evaluated = get_elemento("nombre", "nombreCategoria")
+
+    assert evaluated == ["nombre_categoria"]
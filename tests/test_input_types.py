@@ -0,0 +1,22 @@
+"""Input types generados por app.graphql.schema"""
+import pytest
+
+from app.graphql.schema import create_graphql_types, create_input_types
+
+
+@pytest.fixture
+def inmueble_inputs(inmueble_model):
+    models = [inmueble_model]
+    return create_input_types(models, create_graphql_types(models))
+
+
+def test_denominacion_principal_cached_fuera_de_create_input(inmueble_inputs):
+    create_input = inmueble_inputs["InmuebleCreateInput"]
+    assert "denominacion_principal_cached" not in create_input.__annotations__
+
+
+def test_denominacion_principal_cached_fuera_de_update_input(inmueble_inputs):
+    update_input = inmueble_inputs["InmuebleUpdateInput"]
+    assert "denominacion_principal_cached" not in update_input.__annotations__
+    # El resto de columnas siguen expuestas
+    assert "id" in update_input.__annotations__
@@ -0,0 +1,77 @@
+"""Query plural generada por make_get_all_resolver"""
+import asyncio
+
+import pytest
+
+from app.core.config import settings
+from app.graphql.schema import create_graphql_types, make_get_all_resolver
+
+
+COLUMNAS = ("id", "nombre", "codigo", "categoriaId", "createdAt", "deletedAt")
+
+
+@pytest.fixture
+def elemento_type(elemento_model):
+    return create_graphql_types([elemento_model])["Elemento"]
+
+
+@pytest.fixture
+def list_elementos(elemento_model, elemento_type, db_session, make_info):
+    for numero in range(5):
+        db_session.add(elemento_model(nombre=f"Elemento {numero}", codigo=f"E-{numero}"))
+    asyncio.run(db_session.commit())
+
+    resolver = make_get_all_resolver(elemento_model, elemento_type, "Elemento")
+
+    def _list(fields=("id", "nombre"), **kwargs):
+        return asyncio.run(resolver(make_info(*fields), **kwargs))
+    return _list
+
+
+@pytest.fixture
+def column_getter_calls(elemento_type, monkeypatch):
+    """Cuenta las llamadas al attrgetter de columnas del tipo"""
+    calls = []
+    column_getter = elemento_type._column_getter
+
+    def spy(instance):
+        calls.append(instance)
+        return column_getter(instance)
+    monkeypatch.setattr(elemento_type, "_column_getter", spy)
+    return calls
+
+
+def test_list_usa_el_column_getter_con_relaciones_sin_cargar(list_elementos, column_getter_calls):
+    # 'categoria' no se carga: no debe sacar las filas del camino rápido
+    elementos = list_elementos(fields=COLUMNAS)
+
+    assert len(column_getter_calls) == len(elementos) == 5
+    assert all(elemento.codigo.startswith("E-") and elemento.created_at for elemento in elementos)
+
+
+def test_list_con_columnas_sin_cargar_las_deja_a_none(list_elementos, column_getter_calls):
+    elementos = list_elementos(fields=("nombre",))
+
+    assert column_getter_calls == []
+    assert all(elemento.nombre and elemento.codigo is None for elemento in elementos)
+
+
+def test_list_limit_configurable(list_elementos):
+    assert len(list_elementos(limit=2)) == 2
+    assert len(list_elementos()) == 5
+
+
+def test_list_limit_acotado(list_elementos, monkeypatch):
+    monkeypatch.setattr(settings, "GRAPHQL_MAX_LIMIT", 3)
+    assert len(list_elementos(limit=10**6)) == 3
+    assert len(list_elementos(limit=0)) == 1
+
+
+def test_list_after_continua_tras_el_ultimo_id(list_elementos):
+    primera = list_elementos(limit=3)
+    segunda = list_elementos(limit=3, after=primera[-1].id)
+
+    # Página corta: es la última; entre las dos están todos, sin repetir
+    assert len(segunda) == 2
+    ids = [elemento.id for elemento in primera + segunda]
+    assert ids == sorted(ids) and len(set(ids)) == 5
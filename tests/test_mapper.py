@@ -0,0 +1,33 @@
+"""SQLAlchemyMapper: claves sanitizadas una sola vez por modelo"""
+import pytest
+
+from app.graphql.mapper.base import SQLAlchemyMapper
+from app.graphql.mapper.type_builder import TypeBuilder
+
+
+@pytest.fixture
+def build_calls(monkeypatch):
+    """Argumentos sanitize de cada TypeBuilder.build_type"""
+    calls = []
+    build_type = TypeBuilder.build_type
+
+    def spy(type_name, fields, sanitize=True):
+        calls.append(sanitize)
+        return build_type(type_name, fields, sanitize)
+    monkeypatch.setattr(TypeBuilder, "build_type", staticmethod(spy))
+    return calls
+
+
+@pytest.mark.parametrize("con_libreria", [True, False])
+def test_type_no_vuelve_a_sanitizar(elemento_model, build_calls, con_libreria):
+    mapper = SQLAlchemyMapper()
+    if not con_libreria:
+        mapper.base_mapper = None
+
+    fields = mapper.type(elemento_model).__annotations__
+
+    assert build_calls == [False]
+    assert not TypeBuilder.PYTHON_KEYWORDS.intersection(fields)
+    assert "nombre_categoria" in fields
+    if not con_libreria:
+        assert {"id_", "nombre", "created_at"} <= set(fields)
@@ -0,0 +1,36 @@
+"""warm_up_pool: un connect fallido no deja conexiones fuera del pool"""
+import asyncio
+from types import SimpleNamespace
+
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from app.db.sessions import async_session
+
+
+class _FakeConnection(AsyncConnection):
+    def __init__(self):
+        self.was_closed = False
+
+    async def close(self):
+        self.was_closed = True
+
+
+def test_warm_up_pool_cierra_conexiones_si_un_connect_falla(monkeypatch, caplog):
+    opened = []
+    attempts = iter([True, False, True])
+
+    async def connect():
+        if not next(attempts):
+            raise OSError("connection refused")
+        conn = _FakeConnection()
+        opened.append(conn)
+        return conn
+
+    monkeypatch.setattr(async_session, "engine", SimpleNamespace(connect=connect))
+    monkeypatch.setattr(async_session.settings, "POOL_SIZE", 3)
+
+    asyncio.run(async_session.warm_up_pool(3))
+
+    assert len(opened) == 2
+    assert all(conn.was_closed for conn in opened)
+    assert "2/3" in caplog.text